@@ -4,389 +4,2001 @@ ENT 101 Entrepreneurship Interactive Quiz Application V2
 With Real-Time PDF Extraction and Question Range Selection
 """
 
-import tkinter as tk
-from tkinter import ttk, messagebox, scrolledtext
 import random
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Iterable, Iterator, Callable
 import re
 import os
+import sys
+import json
+import struct
+import queue
+import threading
+import time
+import itertools
+from collections import OrderedDict
+from contextlib import contextmanager
 
-# Try to import PDF libraries
-try:
-    import PyPDF2
-    PDF_LIBRARY = 'PyPDF2'
-except ImportError:
+# Tkinter is imported by load_tkinter() so headless commands (e.g. --compile-bank)
+# run on machines without a display or Tk installed
+tk = ttk = messagebox = None
+
+
+def load_tkinter():
+    """Import the Tk modules into the module namespace (needed before building the UI)"""
+    global tk, ttk, messagebox
+    import tkinter
+    from tkinter import ttk as tk_ttk, messagebox as tk_messagebox
+    tk, ttk, messagebox = tkinter, tk_ttk, tk_messagebox
+
+# PDF libraries, in order of preference. They are found without being imported
+# and only imported once a PDF is actually read; a compiled bank never needs them.
+PDF_BACKENDS = ('PyPDF2', 'pdfplumber')
+_installed_pdf_libraries = None
+
+
+def get_pdf_libraries() -> tuple:
+    """Return the names of all installed PDF libraries, in order of preference"""
+    global _installed_pdf_libraries
+    if _installed_pdf_libraries is None:
+        from importlib.util import find_spec
+        _installed_pdf_libraries = tuple(name for name in PDF_BACKENDS if find_spec(name) is not None)
+    return _installed_pdf_libraries
+
+
+def get_pdf_library() -> Optional[str]:
+    """Return the name of the preferred installed PDF library, or None"""
+    libraries = get_pdf_libraries()
+    return libraries[0] if libraries else None
+
+# Bump whenever parsing logic changes so stale compiled banks are rebuilt
+PARSER_VERSION = "2.4"
+BANK_CACHE_FILE = "question_bank.entbank"
+# Extracted page texts keyed by page content hash, so an edited PDF only re-extracts changed pages
+PAGE_CACHE_FILE = "question_pages.cache"
+PAGE_CACHE_FORMAT = 2
+
+# Source PDFs, looked up in the working directory
+QUESTIONS_PDF = "ENT 101 - Sample Midterm Questions.pdf"
+ANSWERS_TURKISH_PDF = "QuestionsExplanations.pdf"
+ANSWERS_ENGLISH_PDF = "QuestionsExplanationsENG.pdf"
+SOURCE_MAPPING_PDF = "QuestionsSourceMapping.pdf"
+# Explanation languages in display order: language -> (answer-key PDF, label, text shown when missing).
+# The first available answer key also supplies the correct answers
+EXPLANATION_LANGUAGES = {
+    'turkish': (ANSWERS_TURKISH_PDF, "🇹🇷 Turkish", "Açıklama mevcut değil."),
+    'english': (ANSWERS_ENGLISH_PDF, "🇬🇧 English", "No explanation available."),
+}
+DEFAULT_EXPLANATION_LANGUAGE = "english"
+# language_var value that shows every language at once
+ALL_LANGUAGES_CHOICE = "both"
+# Watch mode (--watch) polls the PDFs' mtime and size this often
+WATCH_INTERVAL_MS = 1000
+# Rendered explanation panels kept per session (question id, language, correct)
+EXPLANATION_CACHE_SIZE = 256
+# Questions after the current one prepared while the event loop is idle
+PREFETCH_AHEAD = 2
+
+
+def get_app_dir() -> str:
+    """Return the directory holding the application (or the frozen EXE)"""
+    if getattr(sys, 'frozen', False):
+        return os.path.dirname(os.path.abspath(sys.executable))
+    return os.path.dirname(os.path.abspath(__file__))
+
+
+def answer_key_pdfs(pdf_dir: str = "") -> Dict[str, str]:
+    """Answer-key PDF path of every explanation language"""
+    return {language: os.path.join(pdf_dir, pdf) for language, (pdf, _, _) in EXPLANATION_LANGUAGES.items()}
+
+
+def explanation_languages_for(choice: str) -> List[str]:
+    """Languages shown for a language_var choice"""
+    return list(EXPLANATION_LANGUAGES) if choice == ALL_LANGUAGES_CHOICE else [choice]
+
+# ==================== QUESTION RECORD ====================
+OPTION_LETTERS = ('A', 'B', 'C', 'D')
+
+
+class Question:
+    """Immutable, compact question record
+    
+    Uses __slots__ instead of a per-question dict and stores the options as a
+    fixed A-D tuple, so large (or several) banks stay cheap to keep in memory.
+    Missing text fields are empty strings. Explanations (per language) and
+    source mapping entries are kept in an ExplanationStore and a SourceStore,
+    so they are only loaded when a session shows them.
+    """
+    
+    __slots__ = ('id', 'question', 'options', 'correct')
+    
+    def __init__(self, id: int, question: str, options, correct: str = ""):
+        # Accept either a {letter: text} mapping or an A-D sequence
+        if isinstance(options, dict):
+            options = tuple(options[letter] for letter in OPTION_LETTERS)
+        
+        init = object.__setattr__
+        init(self, 'id', id)
+        init(self, 'question', question)
+        init(self, 'options', tuple(options))
+        init(self, 'correct', sys.intern(correct))
+    
+    def __setattr__(self, name, value):
+        raise AttributeError("Question records are immutable")
+    
+    def __delattr__(self, name):
+        raise AttributeError("Question records are immutable")
+    
+    def __reduce__(self):
+        """Pickle support (worker processes return Question records)"""
+        return (Question, tuple(getattr(self, field) for field in self.__slots__))
+    
+    def __eq__(self, other):
+        if not isinstance(other, Question):
+            return NotImplemented
+        return all(getattr(self, field) == getattr(other, field) for field in self.__slots__)
+    
+    def __hash__(self):
+        return hash((self.id, self.question))
+    
+    def __repr__(self):
+        return f"Question(id={self.id}, question={self.question[:40]!r})"
+    
+    def option_items(self):
+        """(letter, text) pairs in A-D order"""
+        return zip(OPTION_LETTERS, self.options)
+    
+    def to_dict(self) -> Dict:
+        """Plain-dict form used by the bank cache and debug dumps"""
+        data = {field: getattr(self, field) for field in self.__slots__}
+        data['options'] = dict(self.option_items())
+        return data
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'Question':
+        """Rebuild a record from to_dict() output (or a legacy question dict)"""
+        return cls(**{field: data[field] for field in cls.__slots__ if field in data})
+
+
+class QuestionSource:
+    """Immutable source mapping entry of one question
+    
+    The chapter, document and reference fields repeat across a chapter, so
+    they are interned.
+    """
+    
+    __slots__ = ('source', 'source_chapter', 'source_document', 'source_reference', 'topic')
+    
+    def __init__(self, source: str = "", source_chapter: str = "", source_document: str = "",
+                 source_reference: str = "", topic: str = ""):
+        init = object.__setattr__
+        init(self, 'source', source)
+        init(self, 'source_chapter', sys.intern(source_chapter))
+        init(self, 'source_document', sys.intern(source_document))
+        init(self, 'source_reference', sys.intern(source_reference))
+        init(self, 'topic', sys.intern(topic))
+    
+    def __setattr__(self, name, value):
+        raise AttributeError("QuestionSource records are immutable")
+    
+    def __delattr__(self, name):
+        raise AttributeError("QuestionSource records are immutable")
+    
+    def __eq__(self, other):
+        if not isinstance(other, QuestionSource):
+            return NotImplemented
+        return all(getattr(self, field) == getattr(other, field) for field in self.__slots__)
+    
+    def __hash__(self):
+        return hash((self.source_chapter, self.source))
+    
+    @property
+    def has_chapter(self) -> bool:
+        """True when the entry names a chapter (what the quiz screens show)"""
+        return bool(self.source_chapter)
+    
+    def to_dict(self) -> Dict:
+        """Plain-dict form used by debug dumps"""
+        return {field: getattr(self, field) for field in self.__slots__}
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'QuestionSource':
+        """Build an entry from a parsed source mapping row"""
+        return cls(**{field: data[field] for field in cls.__slots__ if field in data})
+
+# ==================== BINARY QUESTION BANK ====================
+# Layout (little-endian):
+#   header   magic, format version, flags, question count, meta length, index offset
+#   meta     UTF-8 JSON (cache key and other build information)
+#   index    one (question id, record offset) entry per question, in bank order
+#   records  one fixed-size record per question: (offset, length) string refs
+#   explanations  per language listed in meta['explanation_languages']: one
+#            (offset, length) ref per question, in bank order
+#   sources  if meta['source_mapping'] is true: one fixed-size record of
+#            BANK_SOURCE_FIELDS refs per question, in bank order
+#   pools    deduplicated UTF-8 string pools: stems, options, explanations, sources
+BANK_MAGIC = b'ENTBANK\x00'
+BANK_FORMAT_VERSION = 3
+BANK_FLAG_SORTED_IDS = 0x1
+BANK_HEADER = struct.Struct('<8sHHIIQ')
+BANK_INDEX_ENTRY = struct.Struct('<II')
+
+# Record fields, in order, with the string pool each one lives in
+BANK_RECORD_FIELDS = (
+    ('question', 'stems'),
+    ('option_a', 'options'), ('option_b', 'options'), ('option_c', 'options'), ('option_d', 'options'),
+    ('correct', 'options')
+)
+BANK_RECORD = struct.Struct('<' + 'II' * len(BANK_RECORD_FIELDS))
+# Source table fields, in order (all in the 'sources' pool)
+BANK_SOURCE_FIELDS = QuestionSource.__slots__
+BANK_SOURCE_RECORD = struct.Struct('<' + 'II' * len(BANK_SOURCE_FIELDS))
+BANK_STRING_REF = struct.Struct('<II')
+BANK_POOLS = ('stems', 'options', 'explanations', 'sources')
+# Serializes bank and page-cache rewrites: full rebuilds and documents parsed on demand
+BANK_UPDATE_LOCK = threading.Lock()
+
+
+def question_field_values(question: Question) -> List[str]:
+    """String values of a question in BANK_RECORD_FIELDS order"""
+    return [question.question] + list(question.options) + [question.correct]
+
+
+def write_question_bank(path: str, questions: List[Question], meta: Dict,
+                        explanations: Optional[Dict[str, Dict[int, str]]] = None,
+                        sources: Optional[Dict[int, QuestionSource]] = None):
+    """Write questions, plus any explanations and source mapping given, to the binary bank format
+    
+    explanations maps a language to {question id: text}; sources maps a question
+    id to its QuestionSource. The write is atomic via a temp file.
+    """
+    # Build deduplicated pools; refs are (pool name, offset within pool, length)
+    pools = {name: bytearray() for name in BANK_POOLS}
+    seen = {name: {} for name in BANK_POOLS}
+    
+    def pooled(pool_name: str, value: str) -> tuple:
+        ref = seen[pool_name].get(value)
+        if ref is None:
+            data = value.encode('utf-8')
+            ref = (len(pools[pool_name]), len(data))
+            pools[pool_name] += data
+            seen[pool_name][value] = ref
+        return pool_name, ref
+    
+    record_refs = [[pooled(pool_name, value)
+                    for (field, pool_name), value in zip(BANK_RECORD_FIELDS, question_field_values(question))]
+                   for question in questions]
+    explanations = explanations or {}
+    languages = list(explanations)
+    explanation_refs = [[pooled('explanations', explanations[language].get(question.id, ""))
+                         for question in questions]
+                        for language in languages]
+    
+    source_refs = []
+    if sources is not None:
+        empty = QuestionSource()
+        source_refs = [[pooled('sources', getattr(sources.get(question.id, empty), field)) for field in BANK_SOURCE_FIELDS]
+                       for question in questions]
+    
+    meta_bytes = json.dumps(dict(meta, explanation_languages=languages, source_mapping=sources is not None),
+                            ensure_ascii=False).encode('utf-8')
+    count = len(questions)
+    index_offset = BANK_HEADER.size + len(meta_bytes)
+    records_offset = index_offset + count * BANK_INDEX_ENTRY.size
+    pool_base = {}
+    offset = (records_offset + count * BANK_RECORD.size + len(languages) * count * BANK_STRING_REF.size +
+              len(source_refs) * BANK_SOURCE_RECORD.size)
+    for name in BANK_POOLS:
+        pool_base[name] = offset
+        offset += len(pools[name])
+    
+    ids = [question.id for question in questions]
+    flags = BANK_FLAG_SORTED_IDS if all(a < b for a, b in zip(ids, ids[1:])) else 0
+    
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(BANK_HEADER.pack(BANK_MAGIC, BANK_FORMAT_VERSION, flags, count, len(meta_bytes), index_offset))
+        f.write(meta_bytes)
+        for position, q_id in enumerate(ids):
+            f.write(BANK_INDEX_ENTRY.pack(q_id, records_offset + position * BANK_RECORD.size))
+        for refs in record_refs:
+            flat = []
+            for pool_name, (pool_offset, length) in refs:
+                flat += [pool_base[pool_name] + pool_offset, length]
+            f.write(BANK_RECORD.pack(*flat))
+        for refs in explanation_refs:
+            for pool_name, (pool_offset, length) in refs:
+                f.write(BANK_STRING_REF.pack(pool_base[pool_name] + pool_offset, length))
+        for refs in source_refs:
+            flat = []
+            for pool_name, (pool_offset, length) in refs:
+                flat += [pool_base[pool_name] + pool_offset, length]
+            f.write(BANK_SOURCE_RECORD.pack(*flat))
+        for name in BANK_POOLS:
+            f.write(pools[name])
+    os.replace(tmp_path, path)
+
+
+class MappedQuestionBank:
+    """Read-only question bank backed by a memory-mapped binary bank file
+    
+    Opening only reads the header and meta block. Questions are decoded the
+    first time they are accessed, so resident memory grows with the number
+    of questions actually viewed rather than with the size of the bank.
+    """
+    
+    def __init__(self, path: str):
+        import mmap
+        
+        self.path = path
+        self._file = open(path, 'rb')
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            magic, version, flags, count, meta_length, index_offset = BANK_HEADER.unpack_from(self._map, 0)
+            if magic != BANK_MAGIC or version != BANK_FORMAT_VERSION:
+                raise ValueError(f"not a version {BANK_FORMAT_VERSION} question bank")
+            self.meta = json.loads(self._map[BANK_HEADER.size:BANK_HEADER.size + meta_length].decode('utf-8'))
+            # Languages whose explanations are stored, each as a table after the records
+            self.explanation_languages = list(self.meta.get('explanation_languages', []))
+            self.has_sources = bool(self.meta.get('source_mapping'))
+            tables_offset = index_offset + count * (BANK_INDEX_ENTRY.size + BANK_RECORD.size)
+            sources_offset = tables_offset + len(self.explanation_languages) * count * BANK_STRING_REF.size
+            if sources_offset + (count * BANK_SOURCE_RECORD.size if self.has_sources else 0) > len(self._map):
+                raise ValueError("question bank is truncated")
+        except Exception:
+            self.close()
+            raise
+        self._count = count
+        self._index_offset = index_offset
+        self._tables_offset = tables_offset
+        self._sources_offset = sources_offset
+        self._sorted_ids = bool(flags & BANK_FLAG_SORTED_IDS)
+        self._decoded = {}
+    
+    def close(self):
+        """Release the memory map and file handle"""
+        if getattr(self, '_map', None) is not None:
+            self._map.close()
+            self._map = None
+        self._file.close()
+    
+    def __len__(self) -> int:
+        return self._count
+    
+    def __iter__(self) -> Iterator[Question]:
+        for index in range(self._count):
+            yield self[index]
+    
+    def question_id(self, index: int) -> int:
+        """Id of the question at index, without decoding the question"""
+        if not 0 <= index < self._count:
+            raise IndexError(index)
+        return BANK_INDEX_ENTRY.unpack_from(self._map, self._index_offset + index * BANK_INDEX_ENTRY.size)[0]
+    
+    def __getitem__(self, index: int) -> Question:
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError(index)
+        
+        question = self._decoded.get(index)
+        if question is None:
+            q_id, record_offset = BANK_INDEX_ENTRY.unpack_from(
+                self._map, self._index_offset + index * BANK_INDEX_ENTRY.size)
+            refs = BANK_RECORD.unpack_from(self._map, record_offset)
+            values = [self._map[refs[i]:refs[i] + refs[i + 1]].decode('utf-8') for i in range(0, len(refs), 2)]
+            question = Question(q_id, values[0], values[1:5], *values[5:])
+            self._decoded[index] = question
+        return question
+    
+    def get_by_id(self, q_id: int) -> Optional[Question]:
+        """Random access by question id (binary search when ids are sorted)"""
+        if self._sorted_ids:
+            low, high = 0, self._count
+            while low < high:
+                middle = (low + high) // 2
+                if self.question_id(middle) < q_id:
+                    low = middle + 1
+                else:
+                    high = middle
+            if low < self._count and self.question_id(low) == q_id:
+                return self[low]
+            return None
+        for index in range(self._count):
+            if self.question_id(index) == q_id:
+                return self[index]
+        return None
+    
+    def load_explanations(self, language: str) -> Dict[int, str]:
+        """Decode one language's explanations as {question id: text} (empty if not stored)"""
+        if language not in self.explanation_languages:
+            return {}
+        table_offset = self._tables_offset + self.explanation_languages.index(language) * self._count * BANK_STRING_REF.size
+        texts = {}
+        for index in range(self._count):
+            offset, length = BANK_STRING_REF.unpack_from(self._map, table_offset + index * BANK_STRING_REF.size)
+            if length:
+                texts[self.question_id(index)] = self._map[offset:offset + length].decode('utf-8')
+        return texts
+    
+    def load_sources(self) -> Dict[int, QuestionSource]:
+        """Decode the source mapping as {question id: QuestionSource} (empty if not stored)"""
+        if not self.has_sources:
+            return {}
+        sources = {}
+        for index in range(self._count):
+            refs = BANK_SOURCE_RECORD.unpack_from(self._map, self._sources_offset + index * BANK_SOURCE_RECORD.size)
+            if any(refs[1::2]):
+                values = [self._map[refs[i]:refs[i] + refs[i + 1]].decode('utf-8') for i in range(0, len(refs), 2)]
+                sources[self.question_id(index)] = QuestionSource(*values)
+        return sources
+
+
+def open_question_bank(path: str) -> Optional[MappedQuestionBank]:
+    """Open a compiled bank, or return None if it is missing or unreadable"""
+    if not os.path.exists(path):
+        return None
     try:
-        import pdfplumber
-        PDF_LIBRARY = 'pdfplumber'
-    except ImportError:
-        PDF_LIBRARY = None
+        return MappedQuestionBank(path)
+    except (OSError, ValueError, struct.error) as e:
+        print(f"Ignoring unreadable question bank '{path}': {e}")
+        return None
+
+# ==================== EXPLANATIONS AND SOURCES ====================
+class ExplanationStore:
+    """Explanation texts per language, each language loaded the first time it is asked for
+    
+    loaders maps a language to a callable returning {question id: text}; it runs
+    at most once. Languages with neither texts nor a loader have no explanations.
+    Like SourceStore, a language is usually loaded on a worker thread ahead of
+    the session; a session that asks for it first waits for the same load.
+    """
+    
+    def __init__(self, texts: Optional[Dict[str, Dict[int, str]]] = None,
+                 loaders: Optional[Dict[str, Callable[[], Dict[int, str]]]] = None):
+        self._texts = dict(texts or {})
+        self._loaders = dict(loaders or {})
+        self._lock = threading.Lock()
+    
+    def is_loaded(self, language: str) -> bool:
+        """True if the language's texts are already in memory"""
+        return language in self._texts
+    
+    def texts(self, language: str) -> Dict[int, str]:
+        """All explanations of one language, loading them on first use"""
+        texts = self._texts.get(language)
+        if texts is not None:
+            return texts
+        with self._lock:
+            texts = self._texts.get(language)
+            if texts is None:
+                loader = self._loaders.pop(language, None)
+                texts = {}
+                if loader is not None:
+                    print(f"→ Loading {language} explanations...")
+                    try:
+                        texts = loader()
+                    except Exception as e:
+                        print(f"Could not load {language} explanations: {e}")
+                self._texts[language] = texts
+        return texts
+    
+    def get(self, q_id: int, language: str) -> str:
+        """Explanation of a question in one language (a placeholder if there is none)"""
+        return self.texts(language).get(q_id) or EXPLANATION_LANGUAGES[language][2]
+
+
+class SourceStore:
+    """Source mapping of a bank, loaded the first time it is asked for
+    
+    The app loads it on a worker thread once the bank is ready; a session
+    that starts before that finishes waits for the same load.
+    """
+    
+    def __init__(self, sources: Optional[Dict[int, QuestionSource]] = None,
+                 loader: Optional[Callable[[], Dict[int, QuestionSource]]] = None):
+        self._sources = sources
+        self._loader = loader
+        self._lock = threading.Lock()
+    
+    def is_loaded(self) -> bool:
+        """True if the source mapping is already in memory"""
+        return self._sources is not None
+    
+    def load(self) -> Dict[int, QuestionSource]:
+        """All source entries, loading them on first use (the result is kept)"""
+        with self._lock:
+            if self._sources is None:
+                sources = {}
+                if self._loader is not None:
+                    print("→ Loading source mapping...")
+                    try:
+                        sources = self._loader()
+                    except Exception as e:
+                        print(f"Could not load source mapping: {e}")
+                self._sources = sources
+                self._loader = None
+        return self._sources
+    
+    def get(self, q_id: int) -> Optional[QuestionSource]:
+        """Source entry of a question, or None if it has none"""
+        return self.load().get(q_id)
+
+# ==================== PAGE CACHE ====================
+class PageCache:
+    """Extracted page texts keyed by "<library>:<page hash>", read from disk when used
+    
+    The file has a format line, one "key<TAB>JSON text" line per page and
+    "#choices<TAB>JSON" lines with the library chosen per document (the last
+    one counts). Loading it only indexes line offsets, so memory does not grow
+    with the page count. A load streams the pages it uses to a new file that
+    replaces the old one on save, dropping unused pages; a document parsed on
+    demand appends its pages to the existing file instead.
+    """
+    CHOICES_KEY = "#choices"
+    
+    def __init__(self):
+        self.path = ""
+        self.offsets: Dict[str, int] = {}
+        # Per document kind, [first page hash, library chosen for it]
+        self.choices: Dict[str, list] = {}
+        # Pages written since begin_rewrite/begin_append, the file they go to, and its size before
+        self.new_offsets: Dict[str, int] = {}
+        self._target = ""
+        self._target_size = 0
+        self._writer = None
+    
+    def __len__(self) -> int:
+        return len(self.offsets)
+    
+    def __contains__(self, key: str) -> bool:
+        return key in self.new_offsets or key in self.offsets
+    
+    def __getstate__(self):
+        # Pool workers get a read-only copy; only this process writes
+        if self._writer is not None:
+            self._writer.flush()
+        state = self.__dict__.copy()
+        state['_writer'] = None
+        return state
+    
+    def load(self, path: str):
+        """Index the page cache file at path (a missing, unreadable or old-format file gives an empty cache)"""
+        self.path = path
+        self.offsets = {}
+        self.choices = {}
+        if not os.path.exists(path):
+            return
+        offsets = {}
+        choices = {}
+        try:
+            with open(path, 'rb') as f:
+                if f.readline().rstrip(b'\n') != f"#format\t{PAGE_CACHE_FORMAT}".encode():
+                    return
+                offset = f.tell()
+                for line in f:
+                    key, _, value = line.partition(b'\t')
+                    key = key.decode('utf-8')
+                    if key == self.CHOICES_KEY:
+                        choices = json.loads(value)
+                    elif line.endswith(b'\n'):
+                        offsets[key] = offset
+                    offset += len(line)
+        except (OSError, ValueError) as e:
+            print(f"Ignoring unreadable page cache: {e}")
+            return
+        self.offsets = offsets
+        self.choices = choices
+    
+    def read_line(self, key: str) -> Optional[bytes]:
+        """Raw cache line of a page, or None if it is not cached"""
+        prefix = key.encode('utf-8') + b'\t'
+        for attempt in range(2):
+            if key in self.new_offsets:
+                if self._writer is not None:
+                    self._writer.flush()
+                path, offset = self._target, self.new_offsets[key]
+            elif key in self.offsets:
+                path, offset = self.path, self.offsets[key]
+            else:
+                return None
+            try:
+                with open(path, 'rb') as f:
+                    f.seek(offset)
+                    line = f.readline()
+            except OSError:
+                line = b''
+            if line.startswith(prefix) and line.endswith(b'\n'):
+                return line
+            if attempt or path != self.path:
+                return None
+            # Another load replaced the file since it was indexed
+            self.load(self.path)
+        return None
+    
+    def get(self, key: str) -> Optional[str]:
+        """Text of a cached page (None if not cached), kept in the file being written"""
+        line = self.read_line(key)
+        if line is None:
+            return None
+        self.keep(key, line)
+        return json.loads(line.partition(b'\t')[2])
+    
+    def keep(self, key: str, line: Optional[bytes] = None):
+        """Carry a cached page over into the file being written, if it is not there yet"""
+        if self._writer is None or key in self.new_offsets or (self._target == self.path and key in self.offsets):
+            return
+        line = line or self.read_line(key)
+        if line is not None:
+            self.new_offsets[key] = self._writer.tell()
+            self._writer.write(line)
+    
+    def put(self, key: str, text: str):
+        """Add an extracted page to the file being written (with none open the page is not kept)"""
+        if self._writer is None:
+            return
+        if key in self:
+            self.keep(key)
+        else:
+            self.new_offsets[key] = self._writer.tell()
+            self._writer.write(f"{key}\t{json.dumps(text, ensure_ascii=False)}\n".encode('utf-8'))
+    
+    def begin_rewrite(self):
+        """Start streaming the pages of this load to a new cache file next to the old one"""
+        self._begin(self.path + '.tmp', 'wb')
+    
+    def begin_append(self):
+        """Start adding pages to the end of the cache file (a new file if there is no valid one)"""
+        if self.offsets or self.choices:
+            self._begin(self.path, 'ab')
+        else:
+            self.begin_rewrite()
+    
+    def _begin(self, target: str, mode: str):
+        self.new_offsets = {}
+        self._target = target
+        try:
+            self._writer = open(target, mode)
+            self._target_size = self._writer.tell()
+            if mode == 'wb':
+                self._writer.write(f"#format\t{PAGE_CACHE_FORMAT}\n".encode())
+        except OSError as e:
+            print(f"Could not write page cache: {e}")
+            self._writer = None
+    
+    def save(self, choices: Dict[str, list]):
+        """Finish writing: record choices (all of them) and replace or extend the old file"""
+        if self._writer is None:
+            return
+        try:
+            self._writer.write(f"{self.CHOICES_KEY}\t{json.dumps(choices)}\n".encode('utf-8'))
+            self._writer.close()
+            self._writer = None
+            if self._target != self.path:
+                os.replace(self._target, self.path)
+                self.offsets = {}
+        except OSError as e:
+            print(f"Could not write page cache: {e}")
+            self.discard()
+            return
+        self.offsets.update(self.new_offsets)
+        self.new_offsets = {}
+        self.choices = choices
+    
+    def discard(self):
+        """Abandon the pages written since begin_rewrite/begin_append, keeping the old file as it was"""
+        if self._writer is None:
+            return
+        self._writer.close()
+        self._writer = None
+        self.new_offsets = {}
+        try:
+            if self._target == self.path:
+                os.truncate(self.path, self._target_size)
+            else:
+                os.remove(self._target)
+        except OSError:
+            pass
+
+# ==================== LOAD INSTRUMENTATION ====================
+class StageTiming:
+    """Wall time, CPU time and traced memory peak of one load stage"""
+    __slots__ = ('name', 'wall', 'cpu', 'peak_bytes')
+    
+    def __init__(self, name: str, wall: float = 0.0, cpu: float = 0.0, peak_bytes: Optional[int] = None):
+        self.name = name
+        self.wall = wall
+        self.cpu = cpu
+        # Growth of traced memory above the stage's starting level (None if not traced)
+        self.peak_bytes = peak_bytes
+    
+    def to_dict(self) -> Dict:
+        """Return the timing as a JSON-ready dict"""
+        return {
+            'stage': self.name,
+            'wall_seconds': round(self.wall, 6),
+            'cpu_seconds': round(self.cpu, 6),
+            'peak_kib': None if self.peak_bytes is None else round(self.peak_bytes / 1024, 1)
+        }
+
+
+class LoadStats:
+    """Per-stage timings collected while loading the question bank"""
+    
+    def __init__(self, trace_memory: bool = False):
+        # tracemalloc slows allocation-heavy code down, so it is opt-in
+        self.trace_memory = trace_memory
+        self.stages: List[StageTiming] = []
+    
+    @contextmanager
+    def stage(self, name: str):
+        """Time the body of a with-block as one stage (stages must not nest)"""
+        timing = StageTiming(name)
+        started_tracing = False
+        if self.trace_memory:
+            import tracemalloc
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                started_tracing = True
+            tracemalloc.reset_peak()
+            base = tracemalloc.get_traced_memory()[0]
+        wall_start, cpu_start = time.perf_counter(), time.process_time()
+        try:
+            yield timing
+        finally:
+            timing.wall = time.perf_counter() - wall_start
+            timing.cpu = time.process_time() - cpu_start
+            if self.trace_memory:
+                timing.peak_bytes = tracemalloc.get_traced_memory()[1] - base
+                if started_tracing:
+                    tracemalloc.stop()
+            self.stages.append(timing)
+    
+    def extend(self, stages: List[StageTiming]):
+        """Merge stages recorded elsewhere (e.g. in a worker process)"""
+        self.stages.extend(stages)
+    
+    def slowest(self) -> Optional[StageTiming]:
+        """Return the stage with the largest wall time"""
+        return max(self.stages, key=lambda timing: timing.wall, default=None)
+    
+    def to_dict(self) -> Dict:
+        """Return all stages as a JSON-ready dict"""
+        return {
+            'trace_memory': self.trace_memory,
+            'stages': [timing.to_dict() for timing in self.stages]
+        }
+    
+    def format_table(self) -> str:
+        """Render the stages as a plain-text table"""
+        lines = [f"{'Stage':<34} {'Wall (s)':>10} {'CPU (s)':>10} {'Peak (KiB)':>12}"]
+        for timing in self.stages:
+            peak = '-' if timing.peak_bytes is None else f"{timing.peak_bytes / 1024:,.1f}"
+            lines.append(f"{timing.name:<34} {timing.wall:>10.4f} {timing.cpu:>10.4f} {peak:>12}")
+        return "\n".join(lines)
+
+
+# ==================== DEBUG DUMP ====================
+# Set to a file path (or "1" for DEBUG_DUMP_FILE) to dump every extracted bank as JSONL
+DEBUG_DUMP_ENV = "ENT101_DEBUG_DUMP"
+DEBUG_DUMP_FILE = "extracted_questions.jsonl"
+
+
+def get_debug_dump_path() -> Optional[str]:
+    """Path requested via ENT101_DEBUG_DUMP (or --debug-dump), or None if dumping is off"""
+    value = os.environ.get(DEBUG_DUMP_ENV, "").strip()
+    if value.lower() in ("", "0", "false", "no"):
+        return None
+    return DEBUG_DUMP_FILE if value.lower() in ("1", "true", "yes") else value
+
+
+def write_debug_dump(path: str, questions: Iterable[Question], meta: Dict,
+                     explanations: Optional[Dict[str, Dict[int, str]]] = None,
+                     sources: Optional[Dict[int, QuestionSource]] = None):
+    """Stream questions to path as JSONL: one meta line, then one line per question
+    
+    Each question line carries the explanations of the languages given, keyed by
+    language, and its source entry if one was given.
+    """
+    explanations = explanations or {}
+    sources = sources or {}
+    tmp_path = path + '.tmp'
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(json.dumps({'meta': meta}, ensure_ascii=False, sort_keys=True) + "\n")
+            count = 0
+            for question in questions:
+                record = question.to_dict()
+                record['explanations'] = {language: texts[question.id]
+                                          for language, texts in explanations.items() if question.id in texts}
+                if question.id in sources:
+                    record['source'] = sources[question.id].to_dict()
+                f.write(json.dumps(record, ensure_ascii=False, sort_keys=True) + "\n")
+                count += 1
+        os.replace(tmp_path, path)
+        print(f"✓ Debug dump of {count} questions written to '{path}'")
+    except OSError as e:
+        print(f"Could not write debug dump: {e}")
+
+
+def start_debug_dump(path: str, questions: Iterable[Question], meta: Dict,
+                     explanations: Optional[Dict[str, Dict[int, str]]] = None,
+                     sources: Optional[Dict[int, QuestionSource]] = None) -> threading.Thread:
+    """Write the debug dump on a background thread (Question records are immutable, so sharing is safe)"""
+    # Not a daemon, so a dump started just before exit still completes
+    writer = threading.Thread(target=write_debug_dump, args=(path, questions, meta, explanations, sources),
+                              name="debug-dump")
+    writer.start()
+    return writer
+
+
+# ==================== DOCUMENT LAYOUTS ====================
+class DocumentLayout:
+    """One known layout of a document kind: a sniffer and a page-stream parser
+    
+    sniff(extractor, sample_text) returns how many records of this layout the
+    sample (the document's first pages) contains; parse(extractor, pages)
+    parses the whole document in a single pass.
+    """
+    __slots__ = ('name', 'sniff', 'parse')
+    
+    def __init__(self, name: str, sniff: Callable[..., int], parse: Callable[..., Dict[int, Dict]]):
+        self.name = name
+        self.sniff = sniff
+        self.parse = parse
+    
+    def __repr__(self):
+        return f"DocumentLayout({self.name!r})"
+
 
 # ==================== PDF EXTRACTION ====================
 class PDFQuestionExtractor:
     """Extract questions and answers from PDF files"""
     
-    def __init__(self, questions_pdf: str, answers_turkish_pdf: str, answers_english_pdf: str, source_mapping_pdf: str = ""):
+    def __init__(self, questions_pdf: str, answer_key_pdfs: Dict[str, str], source_mapping_pdf: str = "",
+                 progress_callback: Optional[Callable[[str, str], None]] = None,
+                 languages: Optional[Iterable[str]] = None, parse_sources: bool = True):
         self.questions_pdf = questions_pdf
-        self.answers_turkish_pdf = answers_turkish_pdf
-        self.answers_english_pdf = answers_english_pdf
+        # Answer-key PDF per explanation language (see answer_key_pdfs())
+        self.answer_key_pdfs = dict(answer_key_pdfs)
         self.source_mapping_pdf = source_mapping_pdf
+        # Languages whose answer keys are parsed up front (None for all) besides the one
+        # supplying the correct answers; the others load on demand
+        self.languages = list(self.answer_key_pdfs if languages is None else languages)
         self.questions = []
-        
-    def extract_with_pypdf2(self, pdf_path: str) -> str:
-        """Extract text using PyPDF2"""
-        text = ""
+        self.used_fallback = False
+        # Explanations parsed by the last load, {language: {question id: text}}
+        self.explanations: Dict[str, Dict[int, str]] = {}
+        # Questions that no parsed answer key covers
+        self.unanswered_ids: List[int] = []
+        # Whether loads parse the source mapping up front, and its entries (None if not parsed)
+        self.parse_sources = parse_sources
+        self.sources: Optional[Dict[int, QuestionSource]] = None
+        # Per-stage timings of the last load; replace with LoadStats(trace_memory=True) to profile memory
+        self.load_stats = LoadStats()
+        # PDF library chosen for each document kind, recorded in the compiled bank
+        self.pdf_backends: Dict[str, str] = {}
+        # Choices carried over from a stale bank for PDFs that have not changed
+        self.backend_hints: Dict[str, str] = {}
+        # Extracted page texts keyed by "<library>:<page hash>" (on disk, see PageCache)
+        self.page_cache = PageCache()
+        # Compiled bank this extractor loaded or built; documents parsed on demand are added to it
+        self.bank_path = ""
+        # Per document kind, the content hash of every page
+        self.page_hashes: Dict[str, List[str]] = {}
+        # Called with (stage, message) as loading progresses; may run on a worker thread
+        self.progress_callback = progress_callback
+    
+    def __getstate__(self):
+        """Drop the progress callback when shipped to a worker process"""
+        state = self.__dict__.copy()
+        state['progress_callback'] = None
+        return state
+    
+    def report_progress(self, stage: str, message: str):
+        """Forward a progress update to the callback, if any"""
+        if self.progress_callback:
+            self.progress_callback(stage, message)
+        
+    # Record start patterns: streamed text is only ever cut right before one of
+    # these, so no question, answer row or source row is split across chunks
+    QUESTION_SPLIT_PATTERN = re.compile(r'\s(\d+)\.\s+')
+    QUESTION_TOKEN_PATTERN = re.compile(r'\s(\d+)\.\s+|([A-D])\)')
+    ANSWER_ROW_PATTERN = re.compile(r'\|\s*(\d+)\.\s*\|\s*([A-D])\s*\|\s*([^|]+)')
+    SIMPLE_ANSWER_PATTERN = re.compile(r'(\d+)[^\w]+([A-D])(?:\s|\|)+')
+    FALLBACK_MAX_ROW_GAP = 5
+    SOURCE_RECORD_PATTERN = re.compile(r'## QUESTIONS|\|\s*\d+\s*\|', re.IGNORECASE)
+    SOURCE_CHAPTER_PATTERN = re.compile(r'## QUESTIONS\s*(\d+)\s*-\s*(\d+)\s*:\s*(Chapter\s+\d+[^|#]+)', re.IGNORECASE)
+    SOURCE_ROW_PATTERN = re.compile(r'\|\s*(\d+)\s*\|([^|]+)\|([^|]+)')
+    
+    # Layout sniffing looks at this many leading pages; the first registered layout
+    # with at least SNIFF_MIN_RECORDS records in them wins, else the best scoring one
+    SNIFF_PAGES = 2
+    SNIFF_MIN_RECORDS = 3
+    
+    def iter_pages_pypdf2(self, pdf_path: str, start: int = 0, stop: Optional[int] = None) -> Iterator[str]:
+        """Yield texts of pages [start, stop) one at a time using PyPDF2"""
         try:
+            import PyPDF2
             with open(pdf_path, 'rb') as file:
-                reader = PyPDF2.PdfReader(file)
-                for page in reader.pages:
-                    text += page.extract_text() + "\n"
+                pages = PyPDF2.PdfReader(file).pages
+                stop = len(pages) if stop is None else min(stop, len(pages))
+                for index in range(start, stop):
+                    yield pages[index].extract_text() or ""
         except Exception as e:
             print(f"PyPDF2 extraction error: {e}")
-        return text
     
-    def extract_with_pdfplumber(self, pdf_path: str) -> str:
-        """Extract text using pdfplumber"""
-        text = ""
+    def iter_pages_pdfplumber(self, pdf_path: str, start: int = 0, stop: Optional[int] = None) -> Iterator[str]:
+        """Yield texts of pages [start, stop) one at a time using pdfplumber"""
         try:
             import pdfplumber
             with pdfplumber.open(pdf_path) as pdf:
-                for page in pdf.pages:
-                    text += page.extract_text() + "\n"
+                for page in pdf.pages[start:stop]:
+                    yield page.extract_text() or ""
         except Exception as e:
             print(f"pdfplumber extraction error: {e}")
-        return text
     
-    def extract_text_from_pdf(self, pdf_path: str) -> str:
-        """Extract text from PDF using available library"""
+    def count_pdf_pages(self, pdf_path: str, backend: str) -> int:
+        """Return the number of pages in a PDF (0 if it cannot be read)"""
+        try:
+            if backend == 'PyPDF2':
+                import PyPDF2
+                with open(pdf_path, 'rb') as file:
+                    return len(PyPDF2.PdfReader(file).pages)
+            elif backend == 'pdfplumber':
+                import pdfplumber
+                with pdfplumber.open(pdf_path) as pdf:
+                    return len(pdf.pages)
+        except Exception as e:
+            print(f"Could not count pages of {pdf_path}: {e}")
+        return 0
+    
+    def iter_pdf_pages(self, pdf_path: str, backend: Optional[str] = None,
+                       start: int = 0, stop: Optional[int] = None) -> Iterator[str]:
+        """Yield texts of pages [start, stop) using the given library (default: the preferred installed one)"""
         if not os.path.exists(pdf_path):
             print(f"PDF file not found: {pdf_path}")
-            return ""
+            return iter(())
         
-        if PDF_LIBRARY == 'PyPDF2':
-            return self.extract_with_pypdf2(pdf_path)
-        elif PDF_LIBRARY == 'pdfplumber':
-            return self.extract_with_pdfplumber(pdf_path)
+        pdf_library = backend or get_pdf_library()
+        if pdf_library == 'PyPDF2':
+            return self.iter_pages_pypdf2(pdf_path, start, stop)
+        elif pdf_library == 'pdfplumber':
+            return self.iter_pages_pdfplumber(pdf_path, start, stop)
         else:
             print("No PDF library available. Please install: pip install PyPDF2 pdfplumber")
-            return ""
+            return iter(())
     
-    def parse_questions(self, text: str) -> List[Dict]:
-        """Parse questions from extracted text"""
-        questions = []
+    # Page keys left out of page hashes: the page tree (other pages) and annotations,
+    # neither of which the extracted text depends on
+    PAGE_HASH_SKIPPED_KEYS = ('Parent', 'Annots')
+    
+    def hash_pages_pypdf2(self, pdf_path: str) -> List[str]:
+        """Hash each page's resolved object tree using PyPDF2
         
-        # Clean up text - remove extra spaces and normalize
-        text = re.sub(r'\s+', ' ', text)
+        The tree covers content streams, fonts (with encodings and text maps)
+        and form XObjects, with streams hashed by their decoded data.
+        """
+        import hashlib
+        import PyPDF2
+        from PyPDF2.generic import IndirectObject, StreamObject
+        skipped = {f"/{key}" for key in self.PAGE_HASH_SKIPPED_KEYS}
+        # Digest per indirect object, as fonts and XObjects are shared between pages
+        memo = {}
+        
+        def object_digest(obj, active=()) -> bytes:
+            if isinstance(obj, IndirectObject):
+                ref = (obj.idnum, obj.generation)
+                if ref in active:
+                    return b'cycle'
+                if ref not in memo:
+                    memo[ref] = object_digest(obj.get_object(), active + (ref,))
+                return memo[ref]
+            digest = hashlib.sha256(type(obj).__name__.encode())
+            if isinstance(obj, dict):
+                for key in sorted(obj):
+                    if key not in skipped:
+                        digest.update(key.encode('utf-8', 'backslashreplace'))
+                        digest.update(object_digest(obj.raw_get(key), active))
+                if isinstance(obj, StreamObject):
+                    digest.update(obj.get_data())
+            elif isinstance(obj, list):
+                for item in obj:
+                    digest.update(object_digest(item, active))
+            else:
+                digest.update(repr(obj).encode('utf-8', 'backslashreplace'))
+            return digest.digest()
         
-        # Split by question numbers (1. 2. 3. etc.)
-        # Look for patterns like "1. " or "1." at start or after newline
-        question_blocks = re.split(r'\s(\d+)\.\s+', text)
+        with open(pdf_path, 'rb') as file:
+            # Inherited resources are copied into each page by PdfReader
+            return [object_digest(page).hex() for page in PyPDF2.PdfReader(file).pages]
+    
+    def hash_pages_pdfplumber(self, pdf_path: str) -> List[str]:
+        """Hash each page's resolved object tree using pdfplumber (see hash_pages_pypdf2)"""
+        import hashlib
+        import pdfplumber
+        from pdfminer.pdftypes import PDFObjRef, PDFStream
+        memo = {}
+        
+        def object_digest(obj, active=()) -> bytes:
+            if isinstance(obj, PDFObjRef):
+                if obj.objid in active:
+                    return b'cycle'
+                if obj.objid not in memo:
+                    memo[obj.objid] = object_digest(obj.resolve(), active + (obj.objid,))
+                return memo[obj.objid]
+            digest = hashlib.sha256(type(obj).__name__.encode())
+            if isinstance(obj, PDFStream):
+                digest.update(object_digest(obj.attrs, active))
+                digest.update(obj.get_data())
+            elif isinstance(obj, dict):
+                for key in sorted(obj):
+                    if key not in self.PAGE_HASH_SKIPPED_KEYS:
+                        digest.update(str(key).encode('utf-8', 'backslashreplace'))
+                        digest.update(object_digest(obj[key], active))
+            elif isinstance(obj, list):
+                for item in obj:
+                    digest.update(object_digest(item, active))
+            else:
+                digest.update(repr(obj).encode('utf-8', 'backslashreplace'))
+            return digest.digest()
         
-        # Process blocks (odd indices are question numbers, even are content)
-        for i in range(1, len(question_blocks), 2):
-            if i+1 >= len(question_blocks):
-                break
-                
-            q_num = int(question_blocks[i])
-            content = question_blocks[i+1].strip()
-            
-            # Find where options start (look for "A)")
-            options_start = content.find('A)')
-            if options_start == -1:
+        with pdfplumber.open(pdf_path) as pdf:
+            # page_obj.resources includes resources inherited from the page tree
+            return [object_digest(dict(page.page_obj.attrs, Resources=page.page_obj.resources)).hex()
+                    for page in pdf.pages]
+    
+    def compute_page_hashes(self, pdf_path: str) -> List[str]:
+        """Hash every page of a PDF without extracting text (empty list if it cannot be read)
+        
+        A page's text only depends on its object tree (content streams, fonts and
+        XObjects), so equal hashes mean the cached text can be reused.
+        """
+        if not pdf_path or not os.path.exists(pdf_path):
+            return []
+        try:
+            if get_pdf_library() == 'PyPDF2':
+                return self.hash_pages_pypdf2(pdf_path)
+            elif get_pdf_library() == 'pdfplumber':
+                return self.hash_pages_pdfplumber(pdf_path)
+        except Exception as e:
+            print(f"Could not hash pages of {pdf_path}: {e}")
+        return []
+    
+    def remember_page(self, backend: str, page_hash: str, text: str):
+        """Store an extracted page text in the page cache being written by this load"""
+        self.page_cache.put(f"{backend}:{page_hash}", text)
+    
+    def iter_cached_pages(self, pdf_path: str, backend: str, hashes: List[str],
+                          start: int = 0, stop: Optional[int] = None) -> Iterator[str]:
+        """Yield texts of pages [start, stop), extracting only pages missing from the page cache"""
+        if not hashes:
+            yield from self.iter_pdf_pages(pdf_path, backend, start, stop)
+            return
+        
+        stop = len(hashes) if stop is None else min(stop, len(hashes))
+        index = start
+        while index < stop:
+            text = self.page_cache.get(f"{backend}:{hashes[index]}")
+            if text is not None:
+                yield text
+                index += 1
                 continue
+            # Extract the whole run of consecutive uncached pages with one open
+            run_end = index + 1
+            while run_end < stop and f"{backend}:{hashes[run_end]}" not in self.page_cache:
+                run_end += 1
+            for offset, text in enumerate(self.iter_pdf_pages(pdf_path, backend, index, run_end)):
+                self.remember_page(backend, hashes[index + offset], text)
+                yield text
+            index = run_end
+    
+    def known_backend(self, kind: str) -> Optional[str]:
+        """Library already chosen for a document: from the old bank, or the page cache if its first page is unchanged"""
+        if kind in self.backend_hints:
+            return self.backend_hints[kind]
+        hashes = self.page_hashes.get(kind)
+        choice = self.page_cache.choices.get(kind)
+        if hashes and choice and choice[0] == hashes[0]:
+            return choice[1]
+        return None
+    
+    def first_page_parses(self, kind: str, text: str) -> bool:
+        """True if one page of text yields at least one record for the document kind"""
+        if kind == 'questions':
+            return next(self.iter_questions([text]), None) is not None
+        if kind.startswith('answers_'):
+            return self.sniff_layout(self.ANSWER_KEY_LAYOUTS, text)[1] > 0
+        return self.sniff_layout(self.SOURCE_MAPPING_LAYOUTS, text)[1] > 0
+    
+    def choose_pdf_backend(self, kind: str, pdf_path: str) -> tuple:
+        """Pick the installed library that extracts the PDF's first page fastest with parseable output
+        
+        Returns (library, page iterator). The first page is not extracted twice: the
+        iterator gets it from the page cache, or continues the winning library's trial.
+        """
+        libraries = get_pdf_libraries()
+        hashes = self.page_hashes.get(kind, [])
+        known = self.known_backend(kind)
+        if known in libraries or len(libraries) < 2 or not os.path.exists(pdf_path):
+            backend = known if known in libraries else get_pdf_library()
+            return backend, self.iter_cached_pages(pdf_path, backend, hashes)
+        
+        trials = []
+        for backend in libraries:
+            pages = self.iter_pdf_pages(pdf_path, backend)
+            start = time.perf_counter()
+            first_page = next(pages, None)
+            elapsed = time.perf_counter() - start
+            parses = first_page is not None and self.first_page_parses(kind, first_page)
+            print(f"   {backend}: first page in {elapsed * 1000:.1f} ms{'' if parses else ' (no records found)'}")
+            trials.append((not parses, elapsed, backend, first_page, pages))
+        
+        # Parseable output first, then speed
+        trials.sort(key=lambda trial: trial[:2])
+        for trial in trials[1:]:
+            trial[4].close()
+        _, _, backend, first_page, pages = trials[0]
+        print(f"   Using {backend} for {kind}")
+        if first_page is None:
+            return backend, pages
+        if hashes:
+            pages.close()
+            self.remember_page(backend, hashes[0], first_page)
+            return backend, itertools.chain([first_page], self.iter_cached_pages(pdf_path, backend, hashes, 1))
+        return backend, itertools.chain([first_page], pages)
+    
+    def extract_with_pypdf2(self, pdf_path: str) -> str:
+        """Extract text using PyPDF2"""
+        return "".join(page + "\n" for page in self.iter_pages_pypdf2(pdf_path))
+    
+    def extract_with_pdfplumber(self, pdf_path: str) -> str:
+        """Extract text using pdfplumber"""
+        return "".join(page + "\n" for page in self.iter_pages_pdfplumber(pdf_path))
+    
+    def extract_text_from_pdf(self, pdf_path: str) -> str:
+        """Extract text from PDF using available library"""
+        return "".join(page + "\n" for page in self.iter_pdf_pages(pdf_path))
+    
+    WHITESPACE_PATTERN = re.compile(r'\s+')
+    
+    def normalize_text(self, text: str, strip_pipes: bool = False) -> str:
+        """Shared normalization stage, run once over each document's text
+        
+        Drops markdown emphasis asterisks (and table pipes when requested)
+        and collapses whitespace, so parsers never re-clean individual fields.
+        """
+        text = text.replace('*', '')
+        if strip_pipes:
+            text = text.replace('|', '')
+        return self.WHITESPACE_PATTERN.sub(' ', text)
+    
+    def iter_record_chunks(self, pages: Iterable[str], record_pattern, strip_pipes: bool = False) -> Iterator[str]:
+        """Normalize streamed pages and yield chunks that end on record boundaries
+        
+        Only the unfinished record at the end of the buffer is carried over to
+        the next page, so memory stays bounded by roughly one page. Joining the
+        chunks gives exactly the normalized text of the document.
+        """
+        buffer = ""
+        for page in pages:
+            page = self.normalize_text(page + "\n", strip_pipes)
+            if buffer.endswith(' ') and page.startswith(' '):
+                page = page[1:]
+            buffer += page
             
-            # Extract question text
-            question_text = content[:options_start].strip()
-            
-            # Extract options
-            options_text = content[options_start:]
+            # Cut before the last record start (it may continue on the next page).
+            # The scan starts at 0 so it sees the same matches as a whole-text scan
+            cut = 0
+            for match in record_pattern.finditer(buffer):
+                cut = match.start()
+            if cut:
+                yield buffer[:cut]
+                buffer = buffer[cut:]
+        
+        if buffer:
+            yield buffer
+    
+    def iter_questions(self, pages: Iterable[str]) -> Iterator[Question]:
+        """Parse questions incrementally from a stream of page texts"""
+        for chunk in self.iter_record_chunks(pages, self.QUESTION_SPLIT_PATTERN):
+            yield from self.tokenize_questions(chunk)
+    
+    def tokenize_questions(self, text: str) -> Iterator[Question]:
+        """Single-pass O(n) tokenizer over normalized question text
+        
+        One regex split emits question-number tokens ("12. ") and option
+        markers ("A)" to "D)") with the text between them; a small state
+        machine turns that stream into questions. An option runs from its
+        first marker to the next B-D marker, as the per-option regexes did.
+        """
+        # parts: [text, num, letter, text, num, letter, text, ...]
+        parts = self.QUESTION_TOKEN_PATTERN.split(text)
+        
+        q_num = None
+        stem = None          # None until the first "A)" of the question
+        pieces = []          # text collected for the stem or the open option
+        options = {}
+        open_letter = None
+        
+        for i in range(1, len(parts), 3):
+            number, letter, text_after = parts[i], parts[i + 1], parts[i + 2]
             
-            # Parse each option
-            options = {}
-            for opt_letter in ['A', 'B', 'C', 'D']:
-                pattern = rf'{opt_letter}\)(.*?)(?=[B-D]\)|$)'
-                match = re.search(pattern, options_text, re.DOTALL)
-                if match:
-                    option_text = match.group(1).strip()
-                    # Clean up option text - remove extra spaces
-                    option_text = re.sub(r'\s+', ' ', option_text)
-                    options[opt_letter] = option_text
+            if number is not None:
+                if q_num is not None:
+                    question = self.finish_question(q_num, stem, pieces, options, open_letter)
+                    if question:
+                        yield question
+                q_num = int(number)
+                stem, pieces, options, open_letter = None, [text_after], {}, None
+            elif q_num is None:
+                continue
+            elif stem is None:
+                # Markers before the first "A)" are part of the stem
+                if letter == 'A':
+                    stem = ''.join(pieces).strip()
+                    pieces, open_letter = [text_after], 'A'
+                else:
+                    pieces += [letter + ')', text_after]
+            elif letter == 'A':
+                # A repeated "A)" never ends an option
+                if open_letter is not None:
+                    pieces += ['A)', text_after]
+            else:
+                # Any B-D marker closes the open option; only a letter's first marker opens one
+                if open_letter is not None:
+                    options[open_letter] = ''.join(pieces).strip()
+                    open_letter = None
+                if letter not in options:
+                    pieces, open_letter = [text_after], letter
+        
+        if q_num is not None:
+            question = self.finish_question(q_num, stem, pieces, options, open_letter)
+            if question:
+                yield question
+    
+    @staticmethod
+    def finish_question(q_num: int, stem: Optional[str], pieces: List[str],
+                        options: Dict[str, str], open_letter: Optional[str]) -> Optional[Question]:
+        """Close the last open option and build the question (None if incomplete)"""
+        if open_letter is not None:
+            options[open_letter] = ''.join(pieces).strip()
+        
+        # Only add if we have all 4 options
+        if len(options) == 4 and stem:
+            return Question(q_num, stem, options)
+        return None
+    
+    def parse_questions(self, text: str) -> List[Question]:
+        """Parse questions from extracted text"""
+        return list(self.iter_questions([text]))
+    
+    # ==================== LAYOUT SNIFFING ====================
+    def sniff_layout(self, layouts: List[DocumentLayout], sample: str) -> tuple:
+        """Pick the layout of a document from a sample of its first pages; returns (layout, score)"""
+        best, best_score = layouts[0], 0
+        for layout in layouts:
+            score = layout.sniff(self, sample)
+            if score >= self.SNIFF_MIN_RECORDS:
+                return layout, score
+            if score > best_score:
+                best, best_score = layout, score
+        return best, best_score
+    
+    def parse_with_layout(self, layouts: List[DocumentLayout], label: str, pages: Iterable[str]) -> Dict[int, Dict]:
+        """Sniff the layout from the leading pages, then parse the whole stream once with it"""
+        pages = iter(pages)
+        head = list(itertools.islice(pages, self.SNIFF_PAGES))
+        layout, _ = self.sniff_layout(layouts, "\n".join(head))
+        print(f"   {label} layout: {layout.name}")
+        return layout.parse(self, itertools.chain(head, pages))
+    
+    @classmethod
+    def register_layout(cls, kind: str, layout: DocumentLayout, preferred: bool = False):
+        """Add a layout for 'answer_key' or 'source_mapping' documents (preferred ones are tried first)"""
+        registry = {'answer_key': cls.ANSWER_KEY_LAYOUTS, 'source_mapping': cls.SOURCE_MAPPING_LAYOUTS}[kind]
+        registry.insert(0 if preferred else len(registry), layout)
+    
+    # ==================== ANSWER KEY LAYOUTS ====================
+    def parse_answer_pages(self, pages: Iterable[str]) -> Dict[int, Dict]:
+        """Parse answers and explanations from a stream of page texts, in the sniffed layout"""
+        return self.parse_with_layout(self.ANSWER_KEY_LAYOUTS, "Answer key", pages)
+    
+    @staticmethod
+    def answer_record(answer: str, explanation: str) -> Dict:
+        """Build an answer entry, padding very short explanations"""
+        # Ensure minimum length
+        if len(explanation) < 15:
+            explanation = f"Correct answer: {answer}. " + explanation
+        return {'correct': answer, 'explanation': explanation}
+    
+    def score_table_answers(self, sample: str) -> int:
+        """Count | 12. | A | explanation | rows in a sample"""
+        return sum(1 for _ in self.ANSWER_ROW_PATTERN.finditer(self.normalize_text(sample)))
+    
+    def parse_table_answer_pages(self, pages: Iterable[str]) -> Dict[int, Dict]:
+        """Table layout with pipes: | Soru No | Cevap | Çözüm/Dayanak |"""
+        answers = {}
+        for chunk in self.iter_record_chunks(pages, self.ANSWER_ROW_PATTERN):
+            for match in self.ANSWER_ROW_PATTERN.finditer(chunk):
+                answers[int(match.group(1))] = self.answer_record(match.group(2).strip(), match.group(3).strip())
+        return answers
+    
+    def iter_simple_answer_rows(self, chunks: Iterable[str]) -> Iterator[tuple]:
+        """Yield (q_num, answer, explanation) for simple-format answer rows in one pass
+        
+        A row is taken when its number follows the previous row by at most
+        FALLBACK_MAX_ROW_GAP, so numbers inside explanations are not mistaken
+        for rows. A larger jump (to the first row, or past a gap in a partial
+        key) is held back and taken only if the next row follows it in the same
+        way; otherwise its text stays part of the current explanation. Before
+        the first row, the earliest candidate is kept and a later jump only
+        extends it, unless that jump is the one confirmed. A candidate still
+        held at the end of the key is taken as its own row.
+        """
+        # (q_num, answer, explanation pieces); a candidate's pieces start with its own row text
+        row = None
+        candidate = None
+        # A later jump inside the first candidate: (q_num, answer, index of its row text)
+        shadow = None
+        
+        for chunk in chunks:
+            position = 0
+            for match in self.SIMPLE_ANSWER_PATTERN.finditer(chunk):
+                target = candidate or row
+                if target is not None:
+                    target[2].append(chunk[position:match.start()])
+                position = match.end()
+                q_num = int(match.group(1))
+                
+                if candidate is not None and q_num == candidate[0]:
+                    # The candidate's own number again, as in "see 3. B" inside its explanation
+                    candidate[2].append(match.group(0))
+                    continue
+                if candidate is not None:
+                    if candidate[0] < q_num <= candidate[0] + self.FALLBACK_MAX_ROW_GAP:
+                        # Confirmed: resync the sequence at the candidate
+                        if row is not None:
+                            yield row[0], row[1], ''.join(row[2]).strip()
+                        row = (candidate[0], candidate[1], candidate[2][1:])
+                    elif shadow is not None and shadow[0] < q_num <= shadow[0] + self.FALLBACK_MAX_ROW_GAP:
+                        # The later jump is confirmed; the first candidate ends where it starts
+                        index = shadow[2]
+                        yield candidate[0], candidate[1], ''.join(candidate[2][1:index]).strip()
+                        row = (shadow[0], shadow[1], candidate[2][index + 1:])
+                    elif row is None:
+                        # Keep the earliest candidate; this jump may still be confirmed
+                        if q_num > candidate[0]:
+                            shadow = (q_num, match.group(2), len(candidate[2]))
+                        candidate[2].append(match.group(0))
+                        continue
+                    else:
+                        row[2].extend(candidate[2])
+                    candidate = shadow = None
+                
+                if row is not None and row[0] < q_num <= row[0] + self.FALLBACK_MAX_ROW_GAP:
+                    yield row[0], row[1], ''.join(row[2]).strip()
+                    row = (q_num, match.group(2), [])
+                elif row is None or q_num > row[0]:
+                    candidate = (q_num, match.group(2), [match.group(0)])
+                else:
+                    row[2].append(match.group(0))
             
-            # Only add if we have all 4 options
-            if len(options) == 4 and question_text:
-                questions.append({
-                    'id': q_num,
-                    'question': question_text,
-                    'options': options
-                })
-        
-        return questions
+            target = candidate or row
+            if target is not None:
+                target[2].append(chunk[position:])
+        
+        if row is not None:
+            yield row[0], row[1], ''.join(row[2]).strip()
+        if candidate is not None:
+            yield candidate[0], candidate[1], ''.join(candidate[2][1:]).strip()
+    
+    def score_simple_answers(self, sample: str) -> int:
+        """Count "12. A explanation" rows in a sample"""
+        return sum(1 for _ in self.iter_simple_answer_rows([self.normalize_text(sample, strip_pipes=True)]))
+    
+    def parse_simple_answer_pages(self, pages: Iterable[str]) -> Dict[int, Dict]:
+        """Simple layout: "12. A explanation", each explanation running up to the next row"""
+        answers = {}
+        chunks = self.iter_record_chunks(pages, self.SIMPLE_ANSWER_PATTERN, strip_pipes=True)
+        for q_num, answer, explanation in self.iter_simple_answer_rows(chunks):
+            if q_num not in answers:
+                answers[q_num] = self.answer_record(answer, explanation[:500])
+        return answers
     
     def parse_answers(self, text: str) -> Dict[int, Dict]:
         """Parse answers and explanations from extracted text (single language)"""
-        answers = {}
-        
-        # Clean text
-        text = re.sub(r'\s+', ' ', text)
-        
-        # Pattern: Table format with pipes | Soru No | Cevap | Çözüm/Dayanak |
-        table_pattern = r'\|\s*\*?\*?(\d+)\.\*?\*?\s*\|\s*\*?\*?([A-D])\*?\*?\s*\|\s*([^|]+)'
-        matches = re.finditer(table_pattern, text)
-        
-        for match in matches:
-            q_num = int(match.group(1))
-            answer = match.group(2).strip()
-            explanation = match.group(3).strip()
+        return self.parse_answer_pages([text])
+    
+    ANSWER_KEY_LAYOUTS = [
+        DocumentLayout('table', score_table_answers, parse_table_answer_pages),
+        DocumentLayout('simple', score_simple_answers, parse_simple_answer_pages),
+    ]
+    
+    # ==================== SOURCE MAPPING LAYOUTS ====================
+    def parse_source_pages(self, pages: Iterable[str]) -> Dict[int, Dict]:
+        """Parse source mapping from a stream of page texts, in the sniffed layout"""
+        return self.parse_with_layout(self.SOURCE_MAPPING_LAYOUTS, "Source mapping", pages)
+    
+    def parse_source_rows(self, chapter_text: str, chapter_title: str, sources: Dict[int, Dict]):
+        """Parse the | 1 | Topic | Source Reference | rows of one chapter section"""
+        for row in self.SOURCE_ROW_PATTERN.finditer(chapter_text):
+            q_num = int(row.group(1))
+            topic = row.group(2).strip()
+            source_ref = row.group(3).strip()
             
-            # Clean explanation
-            explanation = re.sub(r'\*+', '', explanation)
-            explanation = re.sub(r'\s+', ' ', explanation)
+            # Skip header rows
+            if 'Question' in topic or 'Topic' in topic:
+                continue
             
-            # Ensure minimum length
-            if len(explanation) < 15:
-                explanation = f"Correct answer: {answer}. " + explanation
+            # Extract document name if present
+            doc_match = re.search(r'(ENT\s+101[^"|]+\.pdf)', source_ref, re.IGNORECASE)
+            ref_match = re.search(r'\[\[(\d+)\]\]', source_ref)
+            if doc_match:
+                source_document = doc_match.group(1).strip()
+            else:
+                source_document = f"{chapter_title}.pdf" if chapter_title else ""
             
-            answers[q_num] = {
-                'correct': answer,
-                'explanation': explanation
+            sources[q_num] = {
+                'source': source_ref,
+                'source_chapter': chapter_title,
+                'source_document': source_document,
+                'source_reference': ref_match.group(0) if ref_match else "",
+                'topic': topic
             }
-        
-        # Pattern 2: Simple format - if table parsing didn't work well
-        if len(answers) < 10:
-            simple_pattern = r'(\d+)[^\w]+([A-D])(?:\s|\|)+'
-            matches = re.finditer(simple_pattern, text)
-            for match in matches:
-                q_num = int(match.group(1))
-                answer = match.group(2).strip()
+    
+    def score_chapter_sources(self, sample: str) -> int:
+        """Count source rows in a sample that has ## QUESTIONS X-Y: Chapter headers"""
+        text = self.normalize_text(sample)
+        if not self.SOURCE_CHAPTER_PATTERN.search(text):
+            return 0
+        return sum(1 for _ in self.SOURCE_ROW_PATTERN.finditer(text))
+    
+    def parse_chapter_source_pages(self, pages: Iterable[str]) -> Dict[int, Dict]:
+        """Chapter layout: ## QUESTIONS X-Y: Chapter N - Title headers, each followed by a row table"""
+        sources = {}
+        chapter_title = None
+        chapter_count = 0
+        
+        for chunk in self.iter_record_chunks(pages, self.SOURCE_RECORD_PATTERN):
+            # Rows before the first chapter header in this chunk belong to the
+            # chapter carried over from the previous chunk
+            section_start = 0
+            for chapter_match in self.SOURCE_CHAPTER_PATTERN.finditer(chunk):
+                if chapter_title is not None:
+                    self.parse_source_rows(chunk[section_start:chapter_match.start()], chapter_title, sources)
                 
-                if q_num not in answers:
-                    # Try to find explanation after the answer
-                    start_pos = match.end()
-                    end_pos = text.find(str(q_num + 1), start_pos)
-                    if end_pos == -1:
-                        end_pos = start_pos + 500
-                    
-                    explanation = text[start_pos:end_pos].strip()
-                    explanation = re.sub(r'\|+', '', explanation)
-                    explanation = re.sub(r'\*+', '', explanation)
-                    explanation = re.sub(r'\s+', ' ', explanation)
-                    
-                    # Try to detect English/Turkish split
-                    turkish_exp = explanation
-                    english_exp = explanation
-                    
-                    if len(explanation) < 15:
-                        turkish_exp = f"Doğru cevap {answer}. Girişimcilik ilkelerine dayanmaktadır."
-                        english_exp = f"The correct answer is {answer} based on entrepreneurship principles."
-                    
-                    answers[q_num] = {
-                        'correct': answer,
-                        'explanation_turkish': turkish_exp[:500],
-                        'explanation_english': english_exp[:500]
-                    }
+                start_q = int(chapter_match.group(1))
+                end_q = int(chapter_match.group(2))
+                chapter_title = chapter_match.group(3).strip()
+                chapter_count += 1
+                print(f"   Chapter: {chapter_title} (Q{start_q}-{end_q})")
+                section_start = chapter_match.end()
+            
+            if chapter_title is not None:
+                self.parse_source_rows(chunk[section_start:], chapter_title, sources)
         
-        return answers
+        print(f"   Found {chapter_count} chapter sections")
+        print(f"   Parsed {len(sources)} question sources")
+        return sources
+    
+    def score_flat_sources(self, sample: str) -> int:
+        """Count | 1 | Topic | Source Reference | rows in a sample"""
+        return sum(1 for _ in self.SOURCE_ROW_PATTERN.finditer(self.normalize_text(sample)))
+    
+    def parse_flat_source_pages(self, pages: Iterable[str]) -> Dict[int, Dict]:
+        """Flat layout: a single | 1 | Topic | Source Reference | table without chapter headers"""
+        sources = {}
+        for chunk in self.iter_record_chunks(pages, self.SOURCE_RECORD_PATTERN):
+            self.parse_source_rows(chunk, "", sources)
+        print(f"   Parsed {len(sources)} question sources")
+        return sources
     
     def parse_source_mapping(self, text: str) -> Dict[int, Dict]:
         """Parse source mapping from the source PDF"""
-        sources = {}
+        return self.parse_source_pages([text])
+    
+    SOURCE_MAPPING_LAYOUTS = [
+        DocumentLayout('chapters', score_chapter_sources, parse_chapter_source_pages),
+        DocumentLayout('flat', score_flat_sources, parse_flat_source_pages),
+    ]
+    
+    def document_kinds(self) -> List[str]:
+        """Every document kind, in display order: questions, one answer key per language, sources"""
+        return ['questions'] + [f"answers_{language}" for language in self.answer_key_pdfs] + ['source_mapping']
+    
+    def document_source(self, kind: str) -> tuple:
+        """Return (PDF path, page-stream parser) for a document kind"""
+        if kind == 'questions':
+            return self.questions_pdf, lambda pages: list(self.iter_questions(pages))
+        elif kind.startswith('answers_') and kind[len('answers_'):] in self.answer_key_pdfs:
+            return self.answer_key_pdfs[kind[len('answers_'):]], self.parse_answer_pages
+        elif kind == 'source_mapping':
+            return self.source_mapping_pdf, self.parse_source_pages
+        raise ValueError(f"Unknown document kind: {kind}")
+    
+    def extract_document(self, kind: str) -> tuple:
+        """Extract and parse one source PDF
         
-        # Clean text but preserve structure
-        text = re.sub(r'\s+', ' ', text)
+        Returns (char_count, parsed, stage timings, PDF library used).
+        """
+        pdf_path = self.document_source(kind)[0]
+        print(f"\n→ Extracting {kind} from: {pdf_path}")
+        self.report_progress('extracting', f"Extracting {os.path.basename(pdf_path)}...")
+        stats = LoadStats(self.load_stats.trace_memory)
+        with stats.stage(f"choose library {kind}"):
+            backend, pages = self.choose_pdf_backend(kind, pdf_path)
+        char_count, parsed = self.parse_document(kind, pages, stats, f"extract {kind}")
+        return char_count, parsed, stats.stages, backend
+    
+    def parse_document(self, kind: str, pages: Iterator[str], stats: LoadStats, pull_stage: str) -> tuple:
+        """Stream page texts into the kind's parser; returns (char_count, parsed or None if no text)
+        
+        Parsing overlaps page extraction, so time spent pulling pages is booked
+        under pull_stage and the rest as parsing.
+        """
+        pdf_path, parser = self.document_source(kind)
+        char_count = 0
+        page_wall = page_cpu = 0.0
+        
+        def counted_pages():
+            nonlocal char_count, page_wall, page_cpu
+            while True:
+                wall_start, cpu_start = time.perf_counter(), time.process_time()
+                page = next(pages, None)
+                page_wall += time.perf_counter() - wall_start
+                page_cpu += time.process_time() - cpu_start
+                if page is None:
+                    return
+                char_count += len(page) + 1
+                yield page
+        
+        with stats.stage(f"parse {kind}") as parse_timing:
+            parsed = parser(counted_pages())
+        parse_timing.wall -= page_wall
+        parse_timing.cpu -= page_cpu
+        # Both halves ran interleaved, so they share the document's memory peak
+        stats.stages.insert(len(stats.stages) - 1, StageTiming(pull_stage, page_wall, page_cpu, parse_timing.peak_bytes))
+        print(f"   Extracted {char_count} characters from {pdf_path}")
+        self.report_progress('parsing', f"Parsed {os.path.basename(pdf_path)}")
+        return char_count, parsed if char_count else None
+    
+    def combine_questions(self, questions: List[Question], answer_keys: Dict[str, Dict[int, Dict]]) -> List[Question]:
+        """Join parsed questions with their correct answers"""
+        complete_questions = []
+        self.unanswered_ids = []
+        for q in questions:
+            q_id = q.id
+            # The correct answer should be the same in every answer key; the first one listing it wins
+            entry = next((answers[q_id] for answers in answer_keys.values() if q_id in answers), None)
+            if entry is not None:
+                complete_questions.append(Question(q_id, q.question, q.options, correct=entry['correct']))
+            else:
+                # Add without answer (for debugging)
+                complete_questions.append(Question(
+                    q_id, q.question, q.options,
+                    correct='A'  # Default
+                ))
+                self.unanswered_ids.append(q_id)
+                print(f"   ⚠ Warning: No answer found for Q{q_id}")
         
-        # Extract chapter sections
-        # Pattern: ## QUESTIONS X-Y: Chapter N - Title (with flexible spacing)
-        chapter_pattern = r'## QUESTIONS\s*(\d+)\s*-\s*(\d+)\s*:\s*(Chapter\s+\d+[^|#]+)'
-        chapters = list(re.finditer(chapter_pattern, text, re.IGNORECASE))
+        return complete_questions
+    
+    def explanation_store(self, questions) -> ExplanationStore:
+        """Explanations for a loaded bank: languages parsed by this load are kept, the rest load on first use"""
+        loaders = {}
+        for language in EXPLANATION_LANGUAGES:
+            if isinstance(questions, MappedQuestionBank) and language in questions.explanation_languages:
+                loaders[language] = lambda language=language: questions.load_explanations(language)
+            else:
+                loaders[language] = lambda language=language: self.extract_explanations(language)
+        return ExplanationStore(self.explanations, loaders)
+    
+    def source_store(self, questions) -> SourceStore:
+        """Source mapping for a loaded bank: kept if this load parsed it, else loaded on first use"""
+        if self.sources is not None:
+            return SourceStore(self.sources)
+        if isinstance(questions, MappedQuestionBank) and questions.has_sources:
+            return SourceStore(loader=questions.load_sources)
+        return SourceStore(loader=self.extract_sources)
+    
+    def extract_explanations(self, language: str) -> Dict[int, str]:
+        """Parse one language's answer key on demand and store it in the compiled bank; returns {question id: explanation}"""
+        with BANK_UPDATE_LOCK:
+            answers = self.extract_deferred_document(f"answers_{language}")
+            if answers is None:
+                return {}
+            texts = {q_id: entry['explanation'] for q_id, entry in answers.items()}
+            self.add_to_bank(explanations={language: texts})
+        return texts
+    
+    def extract_sources(self) -> Dict[int, QuestionSource]:
+        """Parse the source mapping on demand and store it in the compiled bank; returns {question id: QuestionSource}"""
+        with BANK_UPDATE_LOCK:
+            sources = self.extract_deferred_document('source_mapping')
+            if sources is None:
+                return {}
+            sources = {q_id: QuestionSource.from_dict(entry) for q_id, entry in sources.items()}
+            self.add_to_bank(sources=sources)
+        return sources
+    
+    def extract_deferred_document(self, kind: str) -> Optional[Dict[int, Dict]]:
+        """Parse a document the load left out (None if its PDF is missing or unreadable)
         
-        print(f"   Found {len(chapters)} chapter sections")
+        Reuses the library recorded in the bank and the page cache, and appends
+        newly extracted pages to the page cache. Callers hold BANK_UPDATE_LOCK.
+        """
+        pdf_path = self.document_source(kind)[0]
+        if not pdf_path or not os.path.exists(pdf_path) or get_pdf_library() is None:
+            return None
+        if self.bank_path and not self.page_cache.path:
+            self.load_page_cache(os.path.join(os.path.dirname(self.bank_path), PAGE_CACHE_FILE))
+        self.page_hashes[kind] = self.compute_page_hashes(pdf_path)
+        
+        if self.page_cache.path:
+            self.page_cache.begin_append()
+        try:
+            _, parsed, _, backend = self.extract_document(kind)
+            self.pdf_backends[kind] = backend
+            if self.page_hashes[kind]:
+                self.page_cache.save(dict(self.page_cache.choices, **{kind: [self.page_hashes[kind][0], backend]}))
+        finally:
+            self.page_cache.discard()
+        return parsed
+    
+    # Shards never get smaller than this, so reopening the PDF in each worker stays cheap
+    MIN_SHARD_PAGES = 4
+    
+    def plan_document(self, kind: str) -> tuple:
+        """Choose a library for one PDF, count its pages and extract the first page (pool task)
         
-        for i, chapter_match in enumerate(chapters):
-            start_q = int(chapter_match.group(1))
-            end_q = int(chapter_match.group(2))
-            chapter_title = chapter_match.group(3).strip()
-            
-            print(f"   Chapter: {chapter_title} (Q{start_q}-{end_q})")
-            
-            # Find the section of text for this chapter
-            chapter_start = chapter_match.end()
-            if i + 1 < len(chapters):
-                chapter_end = chapters[i + 1].start()
+        Returns (PDF library, page count, first page text or None, stage timings).
+        """
+        pdf_path = self.document_source(kind)[0]
+        stats = LoadStats(self.load_stats.trace_memory)
+        with stats.stage(f"choose library {kind}"):
+            backend, pages = self.choose_pdf_backend(kind, pdf_path)
+            first_page = next(pages, None)
+            if first_page is None:
+                page_count = 0
             else:
-                chapter_end = len(text)
-            
-            chapter_text = text[chapter_start:chapter_end]
-            
-            # Parse individual question mappings within this chapter
-            # Pattern: | 1 | Topic | Source Reference |
-            row_pattern = r'\|\s*(\d+)\s*\|([^|]+)\|([^|]+)'
-            rows = re.finditer(row_pattern, chapter_text)
-            
-            for row in rows:
-                q_num = int(row.group(1))
-                topic = row.group(2).strip()
-                source_ref = row.group(3).strip()
-                
-                # Skip header rows
-                if 'Question' in topic or 'Topic' in topic:
-                    continue
-                
-                # Extract document name if present
-                doc_match = re.search(r'(ENT\s+101[^"|]+\.pdf)', source_ref, re.IGNORECASE)
-                ref_match = re.search(r'\[\[(\d+)\]\]', source_ref)
-                
-                sources[q_num] = {
-                    'source': source_ref,
-                    'source_chapter': chapter_title,
-                    'source_document': doc_match.group(1).strip() if doc_match else f"{chapter_title}.pdf",
-                    'source_reference': ref_match.group(0) if ref_match else "",
-                    'topic': topic
-                }
+                page_count = len(self.page_hashes.get(kind, [])) or self.count_pdf_pages(pdf_path, backend)
+        return backend, page_count, first_page, stats.stages
+    
+    def extract_page_range(self, kind: str, backend: str, start: int, stop: int) -> tuple:
+        """Extract pages [start, stop) of one PDF (pool task); returns (page texts, stage timing)"""
+        stats = LoadStats(self.load_stats.trace_memory)
+        with stats.stage(f"extract {kind}"):
+            pages = list(self.iter_cached_pages(self.document_source(kind)[0], backend,
+                                                self.page_hashes.get(kind, []), start, stop))
+        return pages, stats.stages[0]
+    
+    def shard_page_ranges(self, page_count: int, workers: int) -> List[tuple]:
+        """Split every page but the first (extracted by plan_document) into contiguous ranges"""
+        remaining = page_count - 1
+        if remaining <= 0:
+            return []
+        size = max(self.MIN_SHARD_PAGES, -(-remaining // workers))
+        return [(start, min(start + size, page_count)) for start in range(1, page_count, size)]
+    
+    def collect_document(self, kind: str, plan: tuple, shard_futures: list) -> tuple:
+        """Parse one document from its plan and page-range shards, in page order
         
-        print(f"   Parsed {len(sources)} question sources")
-        return sources
+        Returns the same tuple as extract_document.
+        """
+        backend, page_count, first_page, plan_stages = plan
+        stats = LoadStats(self.load_stats.trace_memory)
+        stats.extend(plan_stages)
+        shard_timings = []
+        hashes = self.page_hashes.get(kind, [])
+        
+        def ordered_pages():
+            if first_page is None:
+                return
+            yield first_page
+            for start, future in shard_futures:
+                pages, timing = future.result()
+                shard_timings.append(timing)
+                yield from pages
+                # Workers fill their own copy of the page cache, so record their pages here
+                for offset, text in enumerate(pages):
+                    if start + offset < len(hashes):
+                        self.remember_page(backend, hashes[start + offset], text)
+        
+        print(f"\n→ Collecting {kind}: {page_count} pages in {len(shard_futures) + 1} pieces")
+        char_count, parsed = self.parse_document(kind, ordered_pages(), stats, f"wait for {kind} pages")
+        if hashes and first_page is not None:
+            self.remember_page(backend, hashes[0], first_page)
+        
+        # Worker-side extraction work, summed over shards
+        peaks = [timing.peak_bytes for timing in shard_timings if timing.peak_bytes is not None]
+        stats.extend([StageTiming(f"extract {kind}",
+                                  sum(timing.wall for timing in shard_timings),
+                                  sum(timing.cpu for timing in shard_timings),
+                                  max(peaks) if peaks else None)])
+        return char_count, parsed, stats.stages, backend
     
-    def extract_all_questions(self) -> List[Dict]:
-        """Extract and combine questions with answers from both language PDFs"""
-        print("=" * 80)
-        print("Starting PDF Extraction...")
-        print("=" * 80)
+    def extract_documents_parallel(self, kinds: List[str]) -> Dict[str, tuple]:
+        """Extract documents over one process pool, sharding each PDF by page range (serial if unavailable)
+        
+        Shards are parsed here in page order through the same streaming parsers as a
+        serial read, so records that straddle a shard boundary are stitched unchanged.
+        """
+        from concurrent.futures import ProcessPoolExecutor, as_completed
         
-        # Extract text from questions PDF
-        print(f"\n1. Extracting from: {self.questions_pdf}")
-        questions_text = self.extract_text_from_pdf(self.questions_pdf)
-        print(f"   Extracted {len(questions_text)} characters")
+        try:
+            workers = os.cpu_count() or 1
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                plan_futures = {pool.submit(self.plan_document, kind): kind for kind in kinds}
+                plans = {}
+                shard_futures = {}
+                # Queue each document's shards as soon as its page count is known
+                for future in as_completed(plan_futures):
+                    kind = plan_futures[future]
+                    plans[kind] = future.result()
+                    backend, page_count = plans[kind][:2]
+                    shard_futures[kind] = [(start, pool.submit(self.extract_page_range, kind, backend, start, stop))
+                                           for start, stop in self.shard_page_ranges(page_count, workers)]
+                return {kind: self.collect_document(kind, plans[kind], shard_futures[kind]) for kind in kinds}
+        except Exception as e:
+            print(f"Parallel extraction unavailable ({e}), extracting serially")
+            return {kind: self.extract_document(kind) for kind in kinds}
+    
+    def count_uncached_pages(self, kinds: List[str]) -> int:
+        """Number of pages this load has to extract from the PDFs (not in the page cache)"""
+        total = 0
+        for kind in kinds:
+            hashes = self.page_hashes.get(kind, [])
+            backend = self.known_backend(kind)
+            if backend is None:
+                total += len(hashes)
+            else:
+                total += sum(1 for page_hash in hashes if f"{backend}:{page_hash}" not in self.page_cache)
+        return total
+    
+    def extract_all_questions(self, parallel: bool = False) -> List[Question]:
+        """Extract and combine questions with the answer keys of self.languages"""
+        def available(pdf_path: str) -> bool:
+            return bool(pdf_path) and os.path.exists(pdf_path)
+        
+        # Correct answers come from the first available answer key (the keys can disagree),
+        # so it is always parsed; the other languages only if requested
+        languages = [language for language, pdf_path in self.answer_key_pdfs.items() if available(pdf_path)]
+        languages = [language for position, language in enumerate(languages)
+                     if position == 0 or language in self.languages]
+        
+        # Source mapping is optional, and deferred to first use unless parse_sources is set
+        kinds = ['questions'] + [f"answers_{language}" for language in languages]
+        if self.parse_sources and available(self.source_mapping_pdf):
+            kinds.append('source_mapping')
+        
+        # Page hashes let unchanged pages come from the page cache instead of the PDF
+        with self.load_stats.stage("hash pages"):
+            for kind in kinds:
+                self.page_hashes[kind] = self.compute_page_hashes(self.document_source(kind)[0])
+        total_pages = sum(len(self.page_hashes[kind]) for kind in kinds)
+        uncached_pages = self.count_uncached_pages(kinds)
+        if parallel and uncached_pages < 2 * self.MIN_SHARD_PAGES:
+            # Not worth starting a process pool for a few edited pages
+            parallel = False
         
-        # Extract text from Turkish explanations PDF
-        print(f"\n2. Extracting from: {self.answers_turkish_pdf}")
-        answers_turkish_text = self.extract_text_from_pdf(self.answers_turkish_pdf)
-        print(f"   Extracted {len(answers_turkish_text)} characters")
+        print("=" * 80)
+        print(f"Starting PDF Extraction{' (parallel)' if parallel else ''}: "
+              f"{uncached_pages} of {total_pages} pages to extract...")
+        print("=" * 80)
         
-        # Extract text from English explanations PDF
-        print(f"\n3. Extracting from: {self.answers_english_pdf}")
-        answers_english_text = self.extract_text_from_pdf(self.answers_english_pdf)
-        print(f"   Extracted {len(answers_english_text)} characters")
+        if parallel:
+            self.report_progress('extracting', f"Extracting and parsing {len(kinds)} PDFs in parallel...")
+            # Workers time their own documents; this stage is the pool's overall wall time
+            with self.load_stats.stage("parallel extraction"):
+                results = self.extract_documents_parallel(kinds)
+        else:
+            results = {kind: self.extract_document(kind) for kind in kinds}
+        for kind in kinds:
+            self.load_stats.extend(results[kind][2])
+            self.pdf_backends[kind] = results[kind][3]
         
-        if not questions_text:
+        questions_chars, questions = results['questions'][:2]
+        if not questions_chars:
             print("\n❌ Failed to extract questions from PDF")
+            self.used_fallback = True
             return self.get_fallback_questions()
         
-        # Parse questions
-        print("\n4. Parsing questions...")
-        questions = self.parse_questions(questions_text)
-        print(f"   ✓ Extracted {len(questions)} questions")
+        answer_keys = {language: results[f"answers_{language}"][1] or {} for language in languages}
+        # None when the source mapping was deferred (or is missing)
+        sources = (results['source_mapping'][1] or {}) if 'source_mapping' in results else None
         
+        print(f"\n   ✓ Extracted {len(questions)} questions")
         if len(questions) > 0:
-            print(f"   Sample: Q{questions[0]['id']}: {questions[0]['question'][:50]}...")
-        
-        # Parse Turkish answers and explanations
-        print("\n5. Parsing Turkish answers and explanations...")
-        answers_turkish = self.parse_answers(answers_turkish_text)
-        print(f"   ✓ Extracted {len(answers_turkish)} Turkish answers")
-        
-        # Parse English answers and explanations
-        print("\n6. Parsing English answers and explanations...")
-        answers_english = self.parse_answers(answers_english_text)
-        print(f"   ✓ Extracted {len(answers_english)} English answers")
-        
-        # Parse source mapping if available
-        sources = {}
-        if self.source_mapping_pdf and os.path.exists(self.source_mapping_pdf):
-            print(f"\n7. Extracting from: {self.source_mapping_pdf}")
-            source_text = self.extract_text_from_pdf(self.source_mapping_pdf)
-            print(f"   Extracted {len(source_text)} characters")
-            
-            print("\n8. Parsing source mappings...")
-            sources = self.parse_source_mapping(source_text)
+            print(f"   Sample: Q{questions[0].id}: {questions[0].question[:50]}...")
+        for language, answers in answer_keys.items():
+            print(f"   ✓ Extracted {len(answers)} {language.capitalize()} answers")
+        if 'source_mapping' in results:
             print(f"   ✓ Extracted {len(sources)} source mappings")
         
-        if len(answers_turkish) > 0:
-            sample_q = list(answers_turkish.keys())[0]
-            print(f"   Sample: Q{sample_q} = {answers_turkish[sample_q]['correct']}")
-        
-        # Combine questions with both language answers and sources
-        step_num = 9 if sources else 7
-        print(f"\n{step_num}. Combining questions with answers...")
-        complete_questions = []
-        for q in questions:
-            q_id = q['id']
-            if q_id in answers_turkish or q_id in answers_english:
-                # Get correct answer (should be same in both)
-                correct_answer = answers_turkish.get(q_id, {}).get('correct', 
-                                answers_english.get(q_id, {}).get('correct', 'A'))
-                
-                # Get explanations from both languages
-                turkish_explanation = answers_turkish.get(q_id, {}).get('explanation', 'Açıklama mevcut değil.')
-                english_explanation = answers_english.get(q_id, {}).get('explanation', 'Explanation not available.')
-                
-                # Build question dict
-                question_dict = {
-                    'id': q_id,
-                    'question': q['question'],
-                    'options': q['options'],
-                    'correct': correct_answer,
-                    'explanation_turkish': turkish_explanation,
-                    'explanation_english': english_explanation
-                }
-                
-                # Add source information if available
-                if q_id in sources:
-                    question_dict.update({
-                        'source': sources[q_id]['source'],
-                        'source_chapter': sources[q_id]['source_chapter'],
-                        'source_document': sources[q_id]['source_document'],
-                        'source_reference': sources[q_id]['source_reference'],
-                        'topic': sources[q_id]['topic']
-                    })
-                
-                complete_questions.append(question_dict)
-            else:
-                # Add without answer (for debugging)
-                complete_questions.append({
-                    'id': q_id,
-                    'question': q['question'],
-                    'options': q['options'],
-                    'correct': 'A',  # Default
-                    'explanation_turkish': 'Cevap anahtarı PDF\'de bulunamadı.',
-                    'explanation_english': 'Answer key not found in PDF.'
-                })
-                print(f"   ⚠ Warning: No answer found for Q{q_id}")
+        for answers in answer_keys.values():
+            if answers:
+                sample_q = next(iter(answers))
+                print(f"   Sample: Q{sample_q} = {answers[sample_q]['correct']}")
+                break
         
-        step_num = 10 if sources else 8
-        print(f"\n{step_num}. Final result: {len(complete_questions)} complete questions")
+        # Combine questions with the parsed answer keys and sources
+        print("\n→ Combining questions with answers...")
+        self.report_progress('combining', "Combining questions with answers...")
+        with self.load_stats.stage("combine"):
+            complete_questions = self.combine_questions(questions, answer_keys)
+            self.explanations = {language: {q.id: answers[q.id]['explanation'] for q in complete_questions if q.id in answers}
+                                 for language, answers in answer_keys.items()}
+            if sources is not None:
+                # Only answered questions get a source entry
+                self.sources = {q.id: QuestionSource.from_dict(sources[q.id]) for q in complete_questions
+                                if q.id in sources and q.id not in self.unanswered_ids}
+        
+        print(f"\n✓ Final result: {len(complete_questions)} complete questions")
         print("=" * 80)
         
         if not complete_questions:
             print("\n❌ No questions extracted, using fallback")
+            self.used_fallback = True
             return self.get_fallback_questions()
         
-        # Save a sample to file for debugging
-        if len(complete_questions) > 0:
-            try:
-                with open('extracted_sample.txt', 'w', encoding='utf-8') as f:
-                    f.write("First 3 extracted questions:\n\n")
-                    for q in complete_questions[:3]:
-                        f.write(f"Q{q['id']}: {q['question']}\n")
-                        for opt, text in q['options'].items():
-                            f.write(f"  {opt}) {text}\n")
-                        f.write(f"  Correct: {q['correct']}\n")
-                        f.write(f"  Turkish: {q.get('explanation_turkish', 'N/A')}\n")
-                        f.write(f"  English: {q.get('explanation_english', 'N/A')}\n")
-                        if 'source' in q:
-                            f.write(f"  Source: {q.get('source', 'N/A')}\n")
-                            f.write(f"  Chapter: {q.get('source_chapter', 'N/A')}\n")
-                            f.write(f"  Document: {q.get('source_document', 'N/A')}\n")
-                        f.write("\n")
-                print("✓ Sample saved to 'extracted_sample.txt' for verification")
-            except Exception as e:
-                print(f"Could not save sample: {e}")
+        # Opt-in dump of the whole bank for checking or diffing extractor versions
+        dump_path = get_debug_dump_path()
+        if dump_path:
+            start_debug_dump(dump_path, complete_questions,
+                             {'parser_version': PARSER_VERSION, 'pdf_backends': self.pdf_backends},
+                             self.explanations, self.sources)
         
         return complete_questions
     
-    def get_fallback_questions(self) -> List[Dict]:
-        """Fallback questions if PDF extraction fails"""
-        return [
+    # ==================== COMPILED BANK CACHE ====================
+    @staticmethod
+    def file_hash(pdf_path: str) -> str:
+        """Return the SHA-256 of a file's contents (empty string if missing)"""
+        if not pdf_path or not os.path.exists(pdf_path):
+            return ""
+        import hashlib
+        digest = hashlib.sha256()
+        with open(pdf_path, 'rb') as file:
+            for block in iter(lambda: file.read(1 << 20), b''):
+                digest.update(block)
+        return digest.hexdigest()
+    
+    def compute_cache_key(self) -> Dict:
+        """Build the cache key: parser version plus a hash of every input PDF"""
+        return {
+            'parser_version': PARSER_VERSION,
+            'pdfs': {
+                'questions': self.file_hash(self.questions_pdf),
+                **{f"answers_{language}": self.file_hash(pdf_path) for language, pdf_path in self.answer_key_pdfs.items()},
+                'source_mapping': self.file_hash(self.source_mapping_pdf)
+            }
+        }
+    
+    def load_cached_questions(self, cache_path: str) -> Optional[MappedQuestionBank]:
+        """Open the compiled bank if it matches the current PDFs, else None"""
+        bank = open_question_bank(cache_path)
+        if bank is None:
+            return None
+        
+        key = self.compute_cache_key()
+        # Library choices for unchanged PDFs are reused by a rebuild and by documents parsed on demand
+        self.backend_hints = self.reusable_backend_choices(bank.meta, key)
+        if bank.meta.get('key') != key or len(bank) == 0:
+            print("Bank cache is stale (PDFs or parser changed), rebuilding...")
+            bank.close()
+            return None
+        return bank
+    
+    @staticmethod
+    def reusable_backend_choices(meta: Dict, key: Dict) -> Dict[str, str]:
+        """PDF library choices from an old bank's meta for PDFs whose hash is unchanged"""
+        old_hashes = meta.get('key', {}).get('pdfs', {})
+        return {kind: backend for kind, backend in meta.get('pdf_backends', {}).items()
+                if old_hashes.get(kind) and old_hashes.get(kind) == key['pdfs'].get(kind)}
+    
+    def cache_is_current(self, cache_path: str) -> bool:
+        """True if the compiled bank at cache_path matches the current PDFs"""
+        bank = self.load_cached_questions(cache_path)
+        if bank is None:
+            return False
+        bank.close()
+        return True
+    
+    def save_cached_questions(self, cache_path: str, questions: List[Question]):
+        """Write the compiled bank next to the app (skipped on read-only installs)"""
+        try:
+            write_question_bank(cache_path, questions,
+                                {'key': self.compute_cache_key(), 'pdf_backends': self.pdf_backends},
+                                self.explanations, self.sources)
+            print(f"✓ Compiled bank cached to '{cache_path}'")
+        except OSError as e:
+            print(f"Could not write bank cache: {e}")
+    
+    def add_to_bank(self, explanations: Optional[Dict[str, Dict[int, str]]] = None,
+                    sources: Optional[Dict[int, QuestionSource]] = None):
+        """Store documents parsed on demand in the compiled bank, if it still matches the PDFs
+        
+        Later launches then read them from the bank. The bank is rewritten
+        atomically; on Windows that fails while the app maps it, and the update
+        is skipped (the next launch parses the documents again).
+        """
+        bank = open_question_bank(self.bank_path) if self.bank_path else None
+        if bank is None:
+            return
+        try:
+            if bank.meta.get('key') != self.compute_cache_key():
+                return
+            questions = list(bank)
+            stored = {language: bank.load_explanations(language) for language in bank.explanation_languages}
+            stored.update(explanations or {})
+            if sources is None and bank.has_sources:
+                sources = bank.load_sources()
+            meta = dict(bank.meta, pdf_backends=dict(bank.meta.get('pdf_backends', {}), **self.pdf_backends))
+        finally:
+            bank.close()
+        try:
+            write_question_bank(self.bank_path, questions, meta, stored, sources)
+        except OSError as e:
+            print(f"Could not update bank cache: {e}")
+    
+    def load_or_extract_questions(self, cache_path: str, parallel: bool = False):
+        """Load the compiled bank from cache, extracting from PDFs only when needed
+        
+        Returns a MappedQuestionBank on a cache hit, otherwise a list of Question.
+        """
+        self.bank_path = cache_path
+        self.report_progress('cache', "Checking compiled question bank...")
+        with self.load_stats.stage("bank cache lookup"):
+            questions = self.load_cached_questions(cache_path)
+        if questions is not None:
+            print(f"✓ Loaded {len(questions)} questions from bank cache")
+            return questions
+        
+        page_cache_path = os.path.join(os.path.dirname(cache_path), PAGE_CACHE_FILE)
+        # Held for the whole rewrite: the page cache's temp file is written as pages are read,
+        # and an on-demand document (see add_to_bank) would otherwise write the same files
+        with BANK_UPDATE_LOCK:
+            with self.load_stats.stage("page cache read"):
+                self.load_page_cache(page_cache_path)
+            # Pages used by this load are streamed to the new page cache as they are read
+            self.page_cache.begin_rewrite()
+            try:
+                questions = self.extract_all_questions(parallel=parallel)
+                if not self.used_fallback:
+                    with self.load_stats.stage("bank write"):
+                        self.save_cached_questions(cache_path, questions)
+                    with self.load_stats.stage("page cache write"):
+                        self.save_page_cache()
+            finally:
+                self.page_cache.discard()
+        return questions
+    
+    def load_page_cache(self, path: str):
+        """Index the page texts and library choices saved by an earlier load"""
+        self.page_cache.load(path)
+        if len(self.page_cache):
+            print(f"✓ {len(self.page_cache)} extracted pages available from page cache")
+    
+    def save_page_cache(self):
+        """Replace the page cache with the pages used by this load (older pages are dropped)"""
+        # First page hash with the library chosen for it, so an edit elsewhere skips the trial
+        choices = {kind: [self.page_hashes[kind][0], backend]
+                   for kind, backend in self.pdf_backends.items() if self.page_hashes.get(kind)}
+        # Documents this load deferred keep their current pages, so parsing them on demand stays cheap
+        for kind, (first_hash, backend) in self.page_cache.choices.items():
+            if kind in choices or kind not in self.document_kinds():
+                continue
+            hashes = self.compute_page_hashes(self.document_source(kind)[0])
+            for page_hash in hashes:
+                self.page_cache.keep(f"{backend}:{page_hash}")
+            if hashes and hashes[0] == first_hash:
+                choices[kind] = [first_hash, backend]
+        self.page_cache.save(choices)
+    
+    def get_fallback_questions(self) -> List[Question]:
+        """Fallback questions if PDF extraction fails (with explanations in every language)"""
+        fallback = [
             {
                 "id": 1,
                 "question": "One of the most significant economic developments in recent business history relates to the ________.",
@@ -414,10 +2026,105 @@ class PDFQuestionExtractor:
                 "explanation_english": "An entrepreneur's profile encompasses all these characteristics: desire for responsibility, moderate risk preference, confidence, determination, high energy levels, desire for immediate feedback, and future orientation."
             }
         ]
+        self.explanations = {language: {q['id']: q[f"explanation_{language}"] for q in fallback
+                                        if f"explanation_{language}" in q}
+                             for language in EXPLANATION_LANGUAGES}
+        self.sources = {}
+        return [Question.from_dict(q) for q in fallback]
+
+# ==================== LAYOUT MANAGER ====================
+class LayoutManager:
+    """Coalesces window resizes and scroll-region updates for every screen
+    
+    <Configure> events only record what changed; the work runs once per burst
+    from after_idle. Wrap widths are recomputed (and pushed to the widgets) only
+    when the window width actually changes, and a scroll region is only reset
+    when the content's bounding box moved.
+    """
+    
+    def __init__(self, root):
+        self.root = root
+        self._pending = None
+        self._width = None
+        # Wrapped widgets of all screens, as (widget, margin) pairs
+        self._wrapped = []
+        # Wrap length per margin for the current width
+        self._wrap_lengths: Dict[int, int] = {}
+        # Canvases with content that changed size; per canvas, the last scroll region set,
+        # and for fit_width canvases the wanted and the applied content width
+        self._dirty_canvases = []
+        self._regions = {}
+        self._fit_widths = {}
+        self._fitted_widths = {}
+        # One binding for the whole session
+        root.bind('<Configure>', self._on_root_configure)
+    
+    def register_scroll_area(self, canvas, frame, fit_width: bool = False):
+        """Keep canvas's scroll region in step with frame (and frame as wide as canvas if fit_width)"""
+        frame.bind("<Configure>", lambda e: self._mark_canvas(canvas))
+        if fit_width:
+            canvas.bind("<Configure>", lambda e: self._mark_canvas(canvas, e.width))
+    
+    def wrap_length(self, margin: int) -> int:
+        """Wrap length for a widget inset by margin pixels, for the current window width"""
+        if self._width is None:
+            self._width = self.root.winfo_width()
+        length = self._wrap_lengths.get(margin)
+        if length is None:
+            length = self._wrap_lengths[margin] = self._width - margin
+        return length
+    
+    def add_wrapped(self, widget, margin: int):
+        """Wrap widget's text at the window width minus margin, following resizes"""
+        widget.config(wraplength=self.wrap_length(margin))
+        self._wrapped.append((widget, margin))
+    
+    def _on_root_configure(self, event):
+        # The root binding also sees every child's <Configure>; only the window's own matter
+        if event.widget is self.root and event.width != self._width:
+            self._schedule()
+    
+    def _mark_canvas(self, canvas, width: Optional[int] = None):
+        if width is not None:
+            if self._fit_widths.get(canvas) == width:
+                return
+            self._fit_widths[canvas] = width
+        if canvas not in self._dirty_canvases:
+            self._dirty_canvases.append(canvas)
+        self._schedule()
+    
+    def _schedule(self):
+        if self._pending is None:
+            self._pending = self.root.after_idle(self._flush)
+    
+    def _flush(self):
+        """Apply everything recorded since the last flush"""
+        self._pending = None
+        width = self.root.winfo_width()
+        if width != self._width:
+            self._width = width
+            self._wrap_lengths = {}
+            self._wrapped = [(widget, margin) for widget, margin in self._wrapped if widget.winfo_exists()]
+            for widget, margin in self._wrapped:
+                widget.config(wraplength=self.wrap_length(margin))
+        
+        canvases, self._dirty_canvases = self._dirty_canvases, []
+        for canvas in canvases:
+            if not canvas.winfo_exists():
+                continue
+            fit_width = self._fit_widths.get(canvas)
+            if fit_width is not None and fit_width != self._fitted_widths.get(canvas):
+                self._fitted_widths[canvas] = fit_width
+                canvas.itemconfig(canvas.find_withtag("all")[0], width=fit_width)
+            region = canvas.bbox("all")
+            if region != self._regions.get(canvas):
+                self._regions[canvas] = region
+                canvas.configure(scrollregion=region)
+
 
 # ==================== QUIZ APPLICATION CLASS ====================
 class EntrepreneurshipQuiz:
-    def __init__(self, root):
+    def __init__(self, root, watch: bool = False):
         self.root = root
         self.root.title("ENT 101 Entrepreneurship Quiz V2")
         self.root.geometry("1100x850")
@@ -429,42 +2136,272 @@ class EntrepreneurshipQuiz:
         # Set minimum window size
         self.root.minsize(900, 700)
         
-        # Load questions from PDFs
-        self.all_questions = self.load_questions_from_pdfs()
-        
-        # Quiz state variables
+        # Questions are loaded on a worker thread (see start_background_load);
+        # explanations load per language as they are first shown
+        self.all_questions = []
+        self.explanations = ExplanationStore()
+        self.sources = SourceStore()
+        self.bank_ready = False
+        self.load_queue = queue.Queue()
+        
+        # Watch mode: rebuild the bank when a PDF changes (see poll_pdf_changes)
+        self.watch = watch
+        self.reload_queue = queue.Queue()
+        self.reloading = False
+        self.watched_signature = None
+        self.pending_signature = None
+        # Banks replaced by a reload while a session still used them (see close_retired_banks)
+        self.retired_banks = []
+        
+        # Quiz state variables (questions are indices into session_bank, the
+        # bank the session started with; it may be a lazily decoded
+        # MappedQuestionBank and is kept even if watch mode swaps in a new one)
+        self.session_bank = []
+        self.session_explanations = ExplanationStore()
+        self.session_sources = SourceStore()
         self.questions = []
         self.current_question_index = 0
         self.score = 0
         self.answered_count = 0
-        self.incorrect_questions = []
+        self.incorrect_questions = []  # question ids, so they survive a bank reload
+        # Rendered explanation panels of the session, see rendered_explanation
+        self.explanation_cache = OrderedDict()
+        # Display texts of upcoming questions by position in self.questions, see prefetch_questions
+        self.prepared_questions = {}
+        self.prefetch_job = None
         self.start_time = None
         self.answer_submitted = False
         self.selected_answer = tk.StringVar()
         self.quiz_mode = "practice"
         self.question_range = "all"
-        self.explanation_language = "english"  # New: Language preference
+        self.explanation_language = DEFAULT_EXPLANATION_LANGUAGE
         
-        # Initialize UI
+        # Initialize UI; screens are built on first use, then hidden and shown (see show_screen)
+        self.screens = {}
+        self.layout = LayoutManager(self.root)
         self.setup_styles()
         self.show_start_screen()
+        self.start_background_load()
+    
+    def start_background_load(self):
+        """Load the question bank on a worker thread while the start screen is shown"""
+        # Taken before loading so that edits made during the load are picked up
+        self.watched_signature = self.pdf_signature()
+        # Only the answer key that supplies the correct answers is parsed up front; the user has not
+        # chosen an explanation language yet, so it loads when the session starts (see start_quiz)
+        worker = threading.Thread(target=self._load_bank_worker, args=([],), daemon=True)
+        worker.start()
+        self.root.after(50, self.poll_load_queue)
+    
+    def _load_bank_worker(self, languages: List[str]):
+        """Worker thread body: never touches Tk, only posts to load_queue"""
+        try:
+            questions, explanations, sources = self.load_questions_from_pdfs(languages)
+        except Exception as e:
+            self.post_load_message('error', "PDF Extraction Error",
+                                   f"Error extracting questions:\n{str(e)}\n\nUsing fallback questions.")
+            extractor = PDFQuestionExtractor("", {})
+            questions = extractor.get_fallback_questions()
+            explanations = extractor.explanation_store(questions)
+            sources = extractor.source_store(questions)
+        self.load_queue.put(('done', questions, explanations, sources))
+    
+    def post_load_message(self, kind: str, title: str, message: str):
+        """Queue a message box to be shown by the Tk thread"""
+        self.load_queue.put((kind, title, message))
     
-    def load_questions_from_pdfs(self) -> List[Dict]:
-        """Load questions from PDF files"""
+    def report_load_progress(self, stage: str, message: str):
+        """Progress callback for the extractor (called from the worker thread)"""
+        self.load_queue.put(('progress', stage, message))
+    
+    def poll_load_queue(self):
+        """Drain loader messages on the Tk thread until the bank is ready"""
+        try:
+            while True:
+                item = self.load_queue.get_nowait()
+                if item[0] == 'done':
+                    self.on_bank_loaded(*item[1:])
+                    # One watch timer for the whole session; reloads are installed by it
+                    if self.watch:
+                        self.root.after(WATCH_INTERVAL_MS, self.poll_pdf_changes)
+                    return
+                elif item[0] == 'progress':
+                    self.set_load_status(f"⏳ {item[2]}")
+                elif item[0] == 'warning':
+                    messagebox.showwarning(item[1], item[2])
+                elif item[0] == 'info':
+                    messagebox.showinfo(item[1], item[2])
+                elif item[0] == 'error':
+                    messagebox.showerror(item[1], item[2])
+        except queue.Empty:
+            pass
+        self.root.after(50, self.poll_load_queue)
+    
+    def set_load_status(self, text: str):
+        """Update the start screen's loading status line, if it is visible"""
+        if hasattr(self, 'load_status_label') and self.load_status_label.winfo_exists():
+            self.load_status_label.config(text=text)
+    
+    def on_bank_loaded(self, questions, explanations: ExplanationStore, sources: SourceStore):
+        """Install the loaded bank and enable the start screen's mode buttons"""
+        first_load = not self.bank_ready
+        self.all_questions = questions
+        self.explanations = explanations
+        self.sources = sources
+        self.bank_ready = True
+        
+        if hasattr(self, 'info_label') and self.info_label.winfo_exists():
+            self.info_label.config(text=self.get_start_info_text())
+            self.all_range_radio.config(text=f"All Questions\n(Study all {len(self.all_questions)} questions)")
+            if first_load:
+                # Later (watch mode) reloads keep a custom range the user typed
+                self.custom_end.delete(0, 'end')
+                self.custom_end.insert(0, str(len(self.all_questions)))
+            for button in self.mode_buttons:
+                button.config(state='normal')
+        self.set_load_status(f"✓ {len(self.all_questions)} questions ready")
+        self.preload_session_data()
+    
+    def preload_session_data(self):
+        """Load the selected explanation languages and the source mapping on a worker thread
+        
+        Runs once the bank is ready and whenever the language choice changes, so a
+        practice or review session finds them in memory instead of parsing PDFs on
+        the Tk thread. A session started before the worker finishes waits for it.
+        """
+        if not self.bank_ready or not hasattr(self, 'language_var'):
+            return
+        explanations, sources = self.explanations, self.sources
+        languages = [language for language in explanation_languages_for(self.language_var.get())
+                     if not explanations.is_loaded(language)]
+        if languages or not sources.is_loaded():
+            threading.Thread(target=self._preload_worker, args=(explanations, sources, languages),
+                             daemon=True).start()
+    
+    @staticmethod
+    def _preload_worker(explanations: ExplanationStore, sources: SourceStore, languages: List[str]):
+        """Worker for preload_session_data: languages first, then the source mapping"""
+        for language in languages:
+            explanations.texts(language)
+        sources.load()
+    
+    # ==================== WATCH MODE ====================
+    def pdf_signature(self) -> tuple:
+        """(mtime, size) of each source PDF, None for a missing file"""
+        signature = []
+        for path in (QUESTIONS_PDF, *answer_key_pdfs().values(), SOURCE_MAPPING_PDF):
+            try:
+                stat = os.stat(path)
+                signature.append((stat.st_mtime_ns, stat.st_size))
+            except OSError:
+                signature.append(None)
+        return tuple(signature)
+    
+    def poll_pdf_changes(self):
+        """Watch mode timer: rebuild once a PDF change has settled, and install finished rebuilds"""
+        try:
+            reloaded = self.reload_queue.get_nowait()
+        except queue.Empty:
+            pass
+        else:
+            self.reloading = False
+            if reloaded is not None:
+                self.install_reloaded_bank(*reloaded)
+        
+        if not self.reloading:
+            signature = self.pdf_signature()
+            if signature == self.watched_signature:
+                self.pending_signature = None
+            elif signature == self.pending_signature:
+                # Unchanged for a whole interval, so the editor has finished writing
+                self.watched_signature = signature
+                self.pending_signature = None
+                self.reloading = True
+                print("Watch mode: PDF change detected, rebuilding question bank...")
+                languages = explanation_languages_for(self.language_var.get())
+                threading.Thread(target=self._reload_bank_worker, args=(languages,), daemon=True).start()
+            else:
+                self.pending_signature = signature
+        self.root.after(WATCH_INTERVAL_MS, self.poll_pdf_changes)
+    
+    def _reload_bank_worker(self, languages: List[str]):
+        """Watch-mode worker: rebuild the bank (incrementally, via the page cache) and queue it"""
+        reloaded = None
+        try:
+            # On Windows the bank file cannot be replaced while the current bank maps it;
+            # the write is then skipped (and reported) and the rebuilt list is served from memory
+            extractor = PDFQuestionExtractor(QUESTIONS_PDF, answer_key_pdfs(), SOURCE_MAPPING_PDF,
+                                             languages=languages, parse_sources=False)
+            rebuilt = extractor.load_or_extract_questions(os.path.join(get_app_dir(), BANK_CACHE_FILE),
+                                                          parallel=(os.cpu_count() or 1) > 1)
+            # A half-edited PDF may not parse; keep serving the current bank then
+            if extractor.used_fallback:
+                print("Watch mode: rebuilt bank is unusable, keeping the current one")
+            else:
+                reloaded = (rebuilt, extractor.explanation_store(rebuilt), extractor.source_store(rebuilt))
+        except Exception as e:
+            print(f"Watch mode: rebuild failed ({e}), keeping the current one")
+        self.reload_queue.put(reloaded)
+    
+    def install_reloaded_bank(self, questions, explanations: ExplanationStore, sources: SourceStore):
+        """Swap in a rebuilt bank on the Tk thread; a running session keeps its own bank"""
+        print(f"Watch mode: reloaded {len(questions)} questions")
+        if isinstance(self.all_questions, MappedQuestionBank):
+            self.retired_banks.append(self.all_questions)
+        self.on_bank_loaded(questions, explanations, sources)
+        self.close_retired_banks()
+        self.set_load_status(f"↻ Reloaded {len(questions)} questions from the updated PDFs")
+    
+    def close_retired_banks(self):
+        """Close the memory maps of replaced banks that no session uses any more
+        
+        An open map leaks a file handle and, on Windows, keeps the next rebuild
+        from replacing the bank file.
+        """
+        still_used = []
+        for bank in self.retired_banks:
+            if bank is self.session_bank:
+                still_used.append(bank)
+            else:
+                bank.close()
+        self.retired_banks = still_used
+    
+    def load_questions_from_pdfs(self, languages: List[str]) -> tuple:
+        """Load questions from PDF files (runs on the loader thread)
+        
+        Returns (questions, ExplanationStore, SourceStore). Besides the answer key that supplies
+        the correct answers, only the answer keys of languages are parsed now; the other
+        languages and the source mapping load on first use.
+        """
         # PDF file paths
-        questions_pdf = "ENT 101 - Sample Midterm Questions.pdf"
-        answers_turkish_pdf = "QuestionsExplanations.pdf"
-        answers_english_pdf = "QuestionsExplanationsENG.pdf"
-        source_mapping_pdf = "QuestionsSourceMapping.pdf"
+        questions_pdf = QUESTIONS_PDF
+        answers_turkish_pdf = ANSWERS_TURKISH_PDF
+        answers_english_pdf = ANSWERS_ENGLISH_PDF
+        source_mapping_pdf = SOURCE_MAPPING_PDF
+        cache_path = os.path.join(get_app_dir(), BANK_CACHE_FILE)
+        extractor = PDFQuestionExtractor(questions_pdf, answer_key_pdfs(), source_mapping_pdf,
+                                         progress_callback=self.report_load_progress,
+                                         languages=languages, parse_sources=False)
+        
+        def loaded(questions) -> tuple:
+            # Languages loaded later run on the Tk thread, after the load queue is drained
+            extractor.progress_callback = None
+            return questions, extractor.explanation_store(questions), extractor.source_store(questions)
         
         # Check if PDFs exist
         if not os.path.exists(questions_pdf) or not os.path.exists(answers_turkish_pdf):
-            messagebox.showwarning(
+            # Deployments ship only a bank built with --compile-bank, so use it as-is
+            shipped_bank = open_question_bank(cache_path)
+            if shipped_bank is not None and len(shipped_bank) > 0:
+                print(f"✓ Loaded {len(shipped_bank)} questions from compiled bank '{cache_path}'")
+                return loaded(shipped_bank)
+            
+            self.post_load_message(
+                'warning',
                 "PDF Files Not Found",
                 f"Could not find PDF files:\n{questions_pdf}\n{answers_turkish_pdf}\n\nUsing fallback questions."
             )
-            extractor = PDFQuestionExtractor(questions_pdf, answers_turkish_pdf, answers_english_pdf, source_mapping_pdf)
-            return extractor.get_fallback_questions()
+            return loaded(extractor.get_fallback_questions())
         
         # Check if English PDF exists (optional)
         if not os.path.exists(answers_english_pdf):
@@ -474,48 +2411,36 @@ class EntrepreneurshipQuiz:
         if not os.path.exists(source_mapping_pdf):
             print(f"Info: {source_mapping_pdf} not found. Source information will not be available.")
         
-        # Check if PDF library is available
-        if PDF_LIBRARY is None:
-            messagebox.showinfo(
+        # Check if PDF library is available (not needed when the bank cache is valid)
+        if get_pdf_library() is None and not extractor.cache_is_current(cache_path):
+            self.post_load_message(
+                'info',
                 "PDF Library Required",
                 "To extract questions from PDFs, please install:\n\npip install PyPDF2 pdfplumber\n\nUsing fallback questions for now."
             )
-            extractor = PDFQuestionExtractor(questions_pdf, answers_turkish_pdf, answers_english_pdf, source_mapping_pdf)
-            return extractor.get_fallback_questions()
+            return loaded(extractor.get_fallback_questions())
         
-        # Extract questions
+        # Extract questions (or load the compiled bank cache)
         try:
-            extractor = PDFQuestionExtractor(questions_pdf, answers_turkish_pdf, answers_english_pdf, source_mapping_pdf)
-            questions = extractor.extract_all_questions()
+            # Extraction is CPU-bound, so spread the PDFs over all cores
+            parallel = (os.cpu_count() or 1) > 1
+            questions = extractor.load_or_extract_questions(cache_path, parallel=parallel)
             
             if len(questions) < 10:
-                messagebox.showwarning(
+                self.post_load_message(
+                    'warning',
                     "Limited Questions",
                     f"Only {len(questions)} questions were extracted from PDFs.\nYou may want to check the PDF format."
                 )
-            else:
-                messagebox.showinfo(
-                    "Questions Loaded",
-                    f"Successfully loaded {len(questions)} questions from PDFs!"
-                )
-            
-            return questions
-        except Exception as e:
-            messagebox.showerror(
-                "PDF Extraction Error",
-                f"Error extracting questions:\n{str(e)}\n\nUsing fallback questions."
-            )
-            extractor = PDFQuestionExtractor(questions_pdf, answers_turkish_pdf, answers_english_pdf, source_mapping_pdf)
-            return extractor.get_fallback_questions()
             
-            return questions
+            return loaded(questions)
         except Exception as e:
-            messagebox.showerror(
+            self.post_load_message(
+                'error',
                 "PDF Extraction Error",
                 f"Error extracting questions:\n{str(e)}\n\nUsing fallback questions."
             )
-            extractor = PDFQuestionExtractor(questions_pdf, answers_turkish_pdf, answers_english_pdf)
-            return extractor.get_fallback_questions()
+            return loaded(extractor.get_fallback_questions())
     
     def setup_styles(self):
         """Configure custom styles for the application"""
@@ -527,44 +2452,57 @@ class EntrepreneurshipQuiz:
         style.configure('Action.TButton', font=('Arial', 11, 'bold'), padding=8)
         style.configure('Range.TButton', font=('Arial', 10), padding=8)
     
-    def clear_window(self):
-        """Clear all widgets from the window"""
-        for widget in self.root.winfo_children():
-            widget.destroy()
-    
-    def show_start_screen(self):
-        """Display the start screen with mode and range selection"""
-        self.clear_window()
-        
-        # Create a canvas with scrollbar for the start screen
-        canvas = tk.Canvas(self.root, bg="#f0f4f8", highlightthickness=0)
-        scrollbar = tk.Scrollbar(self.root, orient="vertical", command=canvas.yview)
+    def build_screen(self, name: str, fit_width: bool = False):
+        """Create a hidden, scrollable screen and return the frame for its content"""
+        screen = tk.Frame(self.root, bg="#f0f4f8")
+        canvas = tk.Canvas(screen, bg="#f0f4f8", highlightthickness=0)
+        scrollbar = tk.Scrollbar(screen, orient="vertical", command=canvas.yview)
         scrollable_frame = tk.Frame(canvas, bg="#f0f4f8")
         
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
-        
         canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
         canvas.configure(yscrollcommand=scrollbar.set)
+        # Scroll region and canvas-width updates are coalesced by the layout manager
+        self.layout.register_scroll_area(canvas, scrollable_frame, fit_width=fit_width)
         
         # Pack scrollbar and canvas
         scrollbar.pack(side="right", fill="y")
         canvas.pack(side="left", fill="both", expand=True)
+        self.screens[name] = (screen, canvas)
+        return scrollable_frame
+    
+    def show_screen(self, name: str):
+        """Show a built screen scrolled to the top, hiding the others"""
+        for other_name, (other, _) in self.screens.items():
+            if other_name != name:
+                other.pack_forget()
+        screen, canvas = self.screens[name]
+        screen.pack(fill='both', expand=True)
+        canvas.yview_moveto(0)
         
         # Enable mouse wheel scrolling
         def _on_mousewheel(event):
             canvas.yview_scroll(int(-1*(event.delta/120)), "units")
         canvas.bind_all("<MouseWheel>", _on_mousewheel)
         
-        # Update canvas width when window resizes
-        def _on_canvas_resize(event):
-            canvas.itemconfig(canvas.find_withtag("all")[0], width=event.width)
-        canvas.bind("<Configure>", _on_canvas_resize)
-        
+        # Keyboard bindings (only while a question is shown)
+        if name == "question":
+            self.root.bind('<Return>', lambda e: self.submit_answer() if not self.answer_submitted else self.next_question())
+            self.root.bind('<Right>', lambda e: self.next_question() if self.answer_submitted else None)
+            self.root.bind('<Escape>', lambda e: self.confirm_exit())
+        else:
+            for sequence in ('<Return>', '<Right>', '<Escape>'):
+                self.root.unbind(sequence)
+    
+    def show_start_screen(self):
+        """Display the start screen with mode and range selection (range and language choices are kept)"""
+        if "start" not in self.screens:
+            self.build_start_screen()
+        self.show_screen("start")
+    
+    def build_start_screen(self):
+        """Build the start screen once; show_start_screen only shows it again"""
         # Main container inside scrollable frame
-        container = tk.Frame(scrollable_frame, bg="#f0f4f8")
+        container = tk.Frame(self.build_screen("start", fit_width=True), bg="#f0f4f8")
         container.pack(expand=True, fill='both', padx=40, pady=40)
         
         # Title
@@ -591,18 +2529,9 @@ class EntrepreneurshipQuiz:
         info_frame = tk.Frame(container, bg="white", relief='solid', borderwidth=1)
         info_frame.pack(fill='x', pady=15)
         
-        info_text = f"""
-        📚 Total Questions Available: {len(self.all_questions)}
-        ✓ Auto-extracted from PDFs
-        💡 Detailed Explanations
-        📊 Flexible Study Ranges
-        
-        Select study mode and question range:
-        """
-        
-        info_label = tk.Label(
+        self.info_label = tk.Label(
             info_frame,
-            text=info_text,
+            text=self.get_start_info_text(),
             font=('Arial', 11),
             bg="white",
             fg="#334155",
@@ -610,7 +2539,17 @@ class EntrepreneurshipQuiz:
             padx=20,
             pady=15
         )
-        info_label.pack()
+        self.info_label.pack()
+        
+        # Loading status (the bank loads in the background)
+        self.load_status_label = tk.Label(
+            container,
+            text=f"✓ {len(self.all_questions)} questions ready" if self.bank_ready else "⏳ Loading question bank...",
+            font=('Arial', 10, 'italic'),
+            bg="#f0f4f8",
+            fg="#64748b"
+        )
+        self.load_status_label.pack()
         
         # Question Range Selection
         range_frame = tk.LabelFrame(
@@ -654,6 +2593,8 @@ class EntrepreneurshipQuiz:
                 pady=8
             )
             rb.grid(row=i//3, column=i%3, padx=8, pady=5, sticky='w')
+            if value == "all":
+                self.all_range_radio = rb
         
         # Custom range entry (initially hidden)
         self.custom_range_frame = tk.Frame(range_frame, bg="#f0f4f8")
@@ -720,6 +2661,7 @@ class EntrepreneurshipQuiz:
             text="🇬🇧 English\n(English explanations)",
             variable=self.language_var,
             value="english",
+            command=self.preload_session_data,
             font=('Arial', 11, 'bold'),
             bg="#f0f4f8",
             fg="#334155",
@@ -737,6 +2679,7 @@ class EntrepreneurshipQuiz:
             text="🇹🇷 Türkçe\n(Turkish explanations)",
             variable=self.language_var,
             value="turkish",
+            command=self.preload_session_data,
             font=('Arial', 11, 'bold'),
             bg="#f0f4f8",
             fg="#334155",
@@ -754,6 +2697,7 @@ class EntrepreneurshipQuiz:
             text="🌍 Both / İkisi de\n(Show both languages)",
             variable=self.language_var,
             value="both",
+            command=self.preload_session_data,
             font=('Arial', 11, 'bold'),
             bg="#f0f4f8",
             fg="#334155",
@@ -778,12 +2722,16 @@ class EntrepreneurshipQuiz:
         modes_frame = tk.Frame(container, bg="#f0f4f8")
         modes_frame.pack(pady=10)
         
+        # Mode buttons stay disabled until the question bank has loaded
+        button_state = 'normal' if self.bank_ready else 'disabled'
+        
         # Practice Mode
         practice_btn = ttk.Button(
             modes_frame,
             text="🎯 Practice Mode\n(See answers immediately)",
             style='Mode.TButton',
-            command=lambda: self.start_quiz("practice")
+            command=lambda: self.start_quiz("practice"),
+            state=button_state
         )
         practice_btn.grid(row=0, column=0, padx=10, pady=10)
         
@@ -792,7 +2740,8 @@ class EntrepreneurshipQuiz:
             modes_frame,
             text="📝 Test Mode\n(Complete before results)",
             style='Mode.TButton',
-            command=lambda: self.start_quiz("test")
+            command=lambda: self.start_quiz("test"),
+            state=button_state
         )
         test_btn.grid(row=0, column=1, padx=10, pady=10)
         
@@ -801,9 +2750,11 @@ class EntrepreneurshipQuiz:
             modes_frame,
             text="🔍 Review Mode\n(Revisit missed questions)",
             style='Mode.TButton',
-            command=lambda: self.start_quiz("review")
+            command=lambda: self.start_quiz("review"),
+            state=button_state
         )
         review_btn.grid(row=0, column=2, padx=10, pady=10)
+        self.mode_buttons = [practice_btn, test_btn, review_btn]
         
         # Keyboard shortcuts info
         shortcuts = tk.Label(
@@ -815,9 +2766,36 @@ class EntrepreneurshipQuiz:
         )
         shortcuts.pack(side='bottom', pady=10)
     
-    def get_questions_by_range(self, range_type: str) -> List[Dict]:
-        """Get questions based on selected range"""
-        all_q = self.all_questions.copy()
+    def get_start_info_text(self) -> str:
+        """Text for the start screen's info box"""
+        total = len(self.all_questions) if self.bank_ready else "loading..."
+        return f"""
+        📚 Total Questions Available: {total}
+        ✓ Auto-extracted from PDFs
+        💡 Detailed Explanations
+        📊 Flexible Study Ranges
+        
+        Select study mode and question range:
+        """
+    
+    def question_id_at(self, index: int) -> int:
+        """Question id at a session bank index (read from the index for mapped banks)"""
+        if isinstance(self.session_bank, MappedQuestionBank):
+            return self.session_bank.question_id(index)
+        return self.session_bank[index].id
+    
+    def current_question(self) -> Question:
+        """Decode (on first use) and return the question being shown"""
+        return self.session_bank[self.questions[self.current_question_index]]
+    
+    def indices_for_ids(self, question_ids: List[int]) -> List[int]:
+        """Session bank indices of the given question ids (ids no longer in the bank are skipped)"""
+        positions = {self.question_id_at(index): index for index in range(len(self.session_bank))}
+        return [positions[q_id] for q_id in question_ids if q_id in positions]
+    
+    def get_questions_by_range(self, range_type: str) -> List[int]:
+        """Get session bank indices of the questions in the selected range"""
+        all_q = list(range(len(self.session_bank)))
         
         if range_type == "all":
             return all_q
@@ -847,7 +2825,7 @@ class EntrepreneurshipQuiz:
                     return all_q
                 
                 # Filter questions by ID range
-                return [q for q in all_q if start <= q['id'] <= end]
+                return [i for i in all_q if start <= self.question_id_at(i) <= end]
             except ValueError:
                 messagebox.showerror("Invalid Input", "Please enter valid numbers for custom range")
                 return all_q
@@ -864,8 +2842,22 @@ class EntrepreneurshipQuiz:
         # Get questions based on selected range
         range_type = self.range_var.get()
         
+        # The session keeps this bank even if watch mode reloads all_questions meanwhile
+        if self.explanations is not self.session_explanations or self.sources is not self.session_sources:
+            self.explanation_cache.clear()
+        self.session_bank = self.all_questions
+        self.session_explanations = self.explanations
+        self.session_sources = self.sources
+        self.close_retired_banks()
+        if mode != "test":
+            # Normally already loaded by preload_session_data; otherwise this waits for
+            # (or runs) the load here rather than on the first question
+            for language in explanation_languages_for(self.explanation_language):
+                self.session_explanations.texts(language)
+            self.session_sources.load()
+        
         if mode == "review" and self.incorrect_questions:
-            self.questions = self.incorrect_questions.copy()
+            self.questions = self.indices_for_ids(self.incorrect_questions)
             messagebox.showinfo(
                 "Review Mode",
                 f"Reviewing {len(self.questions)} incorrectly answered questions."
@@ -885,124 +2877,90 @@ class EntrepreneurshipQuiz:
             return
         
         # Reset state
+        self.prepared_questions = {}
         self.current_question_index = 0
         self.score = 0
         self.answered_count = 0
         self.start_time = datetime.now()
         
-        # Show first question
+        # Show the question screen set up for this mode, then the first question
+        self.show_question_view()
         self.show_question()
     
-    def show_question(self):
-        """Display the current question"""
-        self.clear_window()
-        self.answer_submitted = False
-        self.selected_answer.set("")
-        
-        question = self.questions[self.current_question_index]
-        
-        # Create a canvas with scrollbar for the question screen
-        canvas = tk.Canvas(self.root, bg="#f0f4f8", highlightthickness=0)
-        scrollbar = tk.Scrollbar(self.root, orient="vertical", command=canvas.yview)
-        scrollable_frame = tk.Frame(canvas, bg="#f0f4f8")
-        
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
-        
-        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
-        
-        # Pack scrollbar and canvas
-        scrollbar.pack(side="right", fill="y")
-        canvas.pack(side="left", fill="both", expand=True)
-        
-        # Enable mouse wheel scrolling
-        def _on_mousewheel(event):
-            canvas.yview_scroll(int(-1*(event.delta/120)), "units")
-        canvas.bind_all("<MouseWheel>", _on_mousewheel)
+    def show_question_view(self):
+        """Show the question screen (built on first use) with the controls of the current mode"""
+        if "question" not in self.screens:
+            self.build_question_view()
+        # Language toggle button (for practice/review mode)
+        if self.quiz_mode in ["practice", "review"]:
+            self.lang_toggle_btn.pack(side='left', padx=15, after=self.next_btn)
+        else:
+            self.lang_toggle_btn.pack_forget()
+        self.show_screen("question")
+    
+    def build_question_view(self):
+        """Build the question screen once; show_question only updates it"""
+        scrollable_frame = self.build_screen("question")
+        self.question_canvas = self.screens["question"][1]
         
         # Main container inside scrollable frame
         main_frame = tk.Frame(scrollable_frame, bg="#f0f4f8")
         main_frame.pack(expand=True, fill='both', padx=30, pady=20)
         
-        # Store reference for dynamic wraplength updates
-        self.current_main_frame = main_frame
-        
         # Header with progress
         header_frame = tk.Frame(main_frame, bg="white", relief='solid', borderwidth=1)
         header_frame.pack(fill='x', pady=(0, 20))
         
         # Progress indicator
-        progress_text = f"Question {self.current_question_index + 1}/{len(self.questions)}"
-        if self.quiz_mode != "test":
-            progress_text += f" | Score: {self.score}/{self.answered_count}"
-            if self.answered_count > 0:
-                percentage = (self.score / self.answered_count) * 100
-                progress_text += f" ({percentage:.1f}%)"
-        
-        progress_label = tk.Label(
+        self.progress_label = tk.Label(
             header_frame,
-            text=progress_text,
             font=('Arial', 12, 'bold'),
             bg="white",
             fg="#1e3a8a",
             pady=10
         )
-        progress_label.pack()
+        self.progress_label.pack()
         
-        # Question text - with dynamic wraplength
+        # Question text - wrapped to the window width by the layout manager
         question_frame = tk.Frame(main_frame, bg="white", relief='solid', borderwidth=1)
         question_frame.pack(fill='both', expand=True, pady=(0, 20))
         
         self.question_label = tk.Label(
             question_frame,
-            text=f"{question['id']}. {question['question']}",
             font=('Arial', 14, 'bold'),
             bg="white",
             fg="#1e293b",
-            wraplength=self.root.winfo_width() - 120,  # Dynamic width
             justify='left',
             padx=20,
             pady=20
         )
+        self.layout.add_wrapped(self.question_label, 120)
         self.question_label.pack(anchor='w', fill='both', expand=True)
         
-        # Source information (if available)
-        if 'source_chapter' in question and self.quiz_mode == "practice":
-            source_info_frame = tk.Frame(question_frame, bg="#e0f2fe", relief='flat')
-            source_info_frame.pack(fill='x', padx=20, pady=(0, 10))
-            
-            source_text = f"📚 {question.get('source_chapter', '')}"
-            if question.get('source_reference'):
-                source_text += f" {question['source_reference']}"
-            
-            source_label = tk.Label(
-                source_info_frame,
-                text=source_text,
-                font=('Arial', 9, 'italic'),
-                bg="#e0f2fe",
-                fg="#0369a1",
-                padx=10,
-                pady=5
-            )
-            source_label.pack(anchor='w')
+        # Source information (packed only for questions that have it)
+        self.source_info_frame = tk.Frame(question_frame, bg="#e0f2fe", relief='flat')
+        self.source_label = tk.Label(
+            self.source_info_frame,
+            font=('Arial', 9, 'italic'),
+            bg="#e0f2fe",
+            fg="#0369a1",
+            padx=10,
+            pady=5
+        )
+        self.source_label.pack(anchor='w')
         
         # Answer options
         options_frame = tk.Frame(main_frame, bg="#f0f4f8")
         options_frame.pack(fill='both', expand=True, pady=(0, 20))
         
         self.option_buttons = {}
-        self.option_radios = []  # Store for dynamic updates
         
-        for key, value in question['options'].items():
+        for key in OPTION_LETTERS:
             option_frame = tk.Frame(options_frame, bg="white", relief='solid', borderwidth=1)
             option_frame.pack(fill='x', pady=5)
             
             radio = tk.Radiobutton(
                 option_frame,
-                text=f"{key}) {value}",
                 variable=self.selected_answer,
                 value=key,
                 font=('Arial', 12),
@@ -1010,21 +2968,18 @@ class EntrepreneurshipQuiz:
                 fg="#334155",
                 activebackground="#e0f2fe",
                 selectcolor="#bfdbfe",
-                wraplength=self.root.winfo_width() - 140,  # Dynamic width
                 justify='left',
                 padx=15,
                 pady=12,
                 cursor="hand2"
             )
+            self.layout.add_wrapped(radio, 140)
             radio.pack(anchor='w', fill='x')
             self.option_buttons[key] = (option_frame, radio)
-            self.option_radios.append((radio, f"{key}) {value}"))
         
-        # Bind window resize event
-        self.root.bind('<Configure>', self._on_window_resize)
-        
-        # Explanation frame (hidden initially)
+        # Explanation frame (hidden until an answer is submitted)
         self.explanation_frame = tk.Frame(main_frame, bg="#fef3c7", relief='solid', borderwidth=2)
+        from tkinter import scrolledtext
         self.explanation_text = scrolledtext.ScrolledText(
             self.explanation_frame,
             font=('Arial', 11),
@@ -1061,14 +3016,12 @@ class EntrepreneurshipQuiz:
         )
         self.next_btn.pack(side='left', padx=5)
         
-        # Language toggle button (for practice/review mode)
-        if self.quiz_mode in ["practice", "review"]:
-            self.lang_toggle_btn = ttk.Button(
-                button_frame,
-                text="🌍 Switch Language",
-                command=self.toggle_explanation_language
-            )
-            self.lang_toggle_btn.pack(side='left', padx=15)
+        # Language toggle button (packed by show_question_view in practice/review mode)
+        self.lang_toggle_btn = ttk.Button(
+            button_frame,
+            text="🌍 Switch Language",
+            command=self.toggle_explanation_language
+        )
         
         # Back to menu button
         menu_btn = ttk.Button(
@@ -1077,11 +3030,88 @@ class EntrepreneurshipQuiz:
             command=self.confirm_exit
         )
         menu_btn.pack(side='right', padx=5)
+    
+    def show_question(self):
+        """Display the current question by updating the persistent question screen in place"""
+        self.answer_submitted = False
+        self.selected_answer.set("")
         
-        # Keyboard bindings
-        self.root.bind('<Return>', lambda e: self.submit_answer() if not self.answer_submitted else self.next_question())
-        self.root.bind('<Right>', lambda e: self.next_question() if self.answer_submitted else None)
-        self.root.bind('<Escape>', lambda e: self.confirm_exit())
+        question_text, option_texts, source_text = (self.prepared_questions.pop(self.current_question_index, None) or
+                                                    self.prepare_question(self.current_question_index))
+        
+        # Progress indicator
+        progress_text = f"Question {self.current_question_index + 1}/{len(self.questions)}"
+        if self.quiz_mode != "test":
+            progress_text += f" | Score: {self.score}/{self.answered_count}"
+            if self.answered_count > 0:
+                percentage = (self.score / self.answered_count) * 100
+                progress_text += f" ({percentage:.1f}%)"
+        self.progress_label.config(text=progress_text)
+        
+        self.question_label.config(text=question_text)
+        
+        # Source information (if available)
+        if source_text is not None:
+            self.source_label.config(text=source_text)
+            self.source_info_frame.pack(fill='x', padx=20, pady=(0, 10))
+        else:
+            self.source_info_frame.pack_forget()
+        
+        # Answer options, reset from the previous question's result colors
+        for key, option_text in zip(OPTION_LETTERS, option_texts):
+            frame, radio = self.option_buttons[key]
+            frame.config(bg="white", borderwidth=1)
+            radio.config(text=option_text, bg="white", state='normal')
+        
+        # Hide the previous explanation
+        self.explanation_frame.pack_forget()
+        self.explanation_text.delete('1.0', 'end')
+        
+        self.submit_btn.config(state='normal')
+        self.next_btn.config(state='disabled')
+        self.question_canvas.yview_moveto(0)
+        self.schedule_prefetch()
+    
+    def prepare_question(self, index: int) -> tuple:
+        """Display texts of the question at a session position: (question, option texts, source or None)
+        
+        Decodes the question from a lazily loaded bank and, in practice and
+        review, renders both possible explanation panels into the cache.
+        """
+        question = self.session_bank[self.questions[index]]
+        option_texts = tuple(f"{key}) {value}" for key, value in question.option_items())
+        
+        source_text = None
+        source = self.source_for(question) if self.quiz_mode == "practice" else None
+        if source is not None:
+            source_text = f"📚 {source.source_chapter}"
+            if source.source_reference:
+                source_text += f" {source.source_reference}"
+        
+        if self.quiz_mode in ["practice", "review"]:
+            self.rendered_explanation(question, True)
+            self.rendered_explanation(question, False)
+        return f"{question.id}. {question.question}", option_texts, source_text
+    
+    def schedule_prefetch(self):
+        """Prepare the next PREFETCH_AHEAD questions the next time the event loop is idle"""
+        if self.prefetch_job is None:
+            self.prefetch_job = self.root.after_idle(self.prefetch_questions)
+    
+    def prefetch_questions(self):
+        """Idle callback: prepare one upcoming question, rescheduling itself for the next one"""
+        self.prefetch_job = None
+        # Drop questions already passed (e.g. after a session restart)
+        for index in [index for index in self.prepared_questions if index <= self.current_question_index]:
+            del self.prepared_questions[index]
+        
+        last = min(self.current_question_index + PREFETCH_AHEAD, len(self.questions) - 1)
+        for index in range(self.current_question_index + 1, last + 1):
+            if index not in self.prepared_questions:
+                # One question per idle pass, so input events are handled in between
+                self.prepared_questions[index] = self.prepare_question(index)
+                self.schedule_prefetch()
+                return
     
     def submit_answer(self):
         """Process the submitted answer"""
@@ -1093,8 +3123,8 @@ class EntrepreneurshipQuiz:
             messagebox.showwarning("No Selection", "Please select an answer before submitting.")
             return
         
-        question = self.questions[self.current_question_index]
-        correct_answer = question['correct']
+        question = self.current_question()
+        correct_answer = question.correct
         
         self.answer_submitted = True
         self.answered_count += 1
@@ -1115,56 +3145,18 @@ class EntrepreneurshipQuiz:
         # Update score
         if selected == correct_answer:
             self.score += 1
-            result_icon = "✓"
-            result_color = "#16a34a"
-            result_text = "CORRECT!"
-        else:
-            result_icon = "✗"
-            result_color = "#dc2626"
-            result_text = f"INCORRECT! The correct answer is {correct_answer}"
-            if question not in self.incorrect_questions:
-                self.incorrect_questions.append(question)
+        elif question.id not in self.incorrect_questions:
+            self.incorrect_questions.append(question.id)
         
         # Show explanation
         if self.quiz_mode in ["practice", "review"]:
-            # Get explanation based on selected language
-            explanation_text = ""
-            
-            if self.explanation_language == "english":
-                explanation_text = question.get('explanation_english', question.get('explanation', 'No explanation available.'))
-            elif self.explanation_language == "turkish":
-                explanation_text = question.get('explanation_turkish', question.get('explanation', 'Açıklama mevcut değil.'))
-            elif self.explanation_language == "both":
-                turkish_exp = question.get('explanation_turkish', 'Türkçe açıklama mevcut değil.')
-                english_exp = question.get('explanation_english', 'No English explanation available.')
-                explanation_text = f"🇹🇷 Turkish:\n{turkish_exp}\n\n🇬🇧 English:\n{english_exp}"
-            
-            # Add source information if available
-            source_info = ""
-            if 'source_chapter' in question:
-                source_info = f"\n\n📚 Source Information:"
-                source_info += f"\n• Chapter: {question.get('source_chapter', 'N/A')}"
-                if question.get('topic'):
-                    source_info += f"\n• Topic: {question.get('topic', 'N/A')}"
-                if question.get('source'):
-                    source_info += f"\n• Details: {question.get('source', 'N/A')}"
-                if question.get('source_reference'):
-                    source_info += f"\n• Reference: {question.get('source_reference', 'N/A')}"
-            
-            explanation_content = f"{result_icon} {result_text}\n\n💡 Explanation:\n{explanation_text}{source_info}"
-            self.explanation_text.delete('1.0', 'end')
-            self.explanation_text.insert('1.0', explanation_content)
-            
-            self.explanation_text.tag_add("result", "1.0", "1.end")
-            self.explanation_text.tag_config("result", font=('Arial', 12, 'bold'), foreground=result_color)
-            
-            self.explanation_frame.config(bg="#fef3c7" if selected == correct_answer else "#fee2e2")
-            self.explanation_text.config(bg="#fef3c7" if selected == correct_answer else "#fee2e2")
+            self.show_explanation(question, selected == correct_answer)
             self.explanation_frame.pack(fill='both', expand=True, pady=(0, 20))
         
         # Update buttons
         self.submit_btn.config(state='disabled')
         self.next_btn.config(state='normal')
+        self.schedule_prefetch()
         
         # Auto-advance in test mode
         if self.quiz_mode == "test":
@@ -1182,34 +3174,88 @@ class EntrepreneurshipQuiz:
         else:
             self.show_results()
     
-    def _on_window_resize(self, event):
-        """Handle window resize to adjust text wrapping"""
-        # Only process resize events from the root window
-        if event.widget != self.root:
-            return
+    def rendered_explanation(self, question: Question, correct: bool) -> tuple:
+        """Explanation panel content for the current language: (text, [(tag, start, end, options)])
         
-        # Update wraplength for question and options dynamically
-        new_width = self.root.winfo_width()
-        
-        if hasattr(self, 'question_label') and self.question_label.winfo_exists():
-            self.question_label.config(wraplength=new_width - 120)
+        Memoized per (question id, language, correct) in a small LRU cache, so
+        toggling languages back and forth only swaps cached buffers.
+        """
+        key = (question.id, self.explanation_language, correct)
+        rendered = self.explanation_cache.get(key)
+        if rendered is not None:
+            self.explanation_cache.move_to_end(key)
+            return rendered
         
-        if hasattr(self, 'option_radios'):
-            for radio, text in self.option_radios:
-                if radio.winfo_exists():
-                    radio.config(wraplength=new_width - 140)
+        if correct:
+            result_icon = "✓"
+            result_color = "#16a34a"
+            result_text = "CORRECT!"
+        else:
+            result_icon = "✗"
+            result_color = "#dc2626"
+            result_text = f"INCORRECT! The correct answer is {question.correct}"
+        
+        # Explanation in the selected language(s), plus source information if available
+        content = (f"{result_icon} {result_text}\n\n💡 Explanation:\n"
+                   f"{self.explanation_for(question)}{self.source_info_for(question)}")
+        rendered = (content, [("result", "1.0", "1.end", {'font': ('Arial', 12, 'bold'), 'foreground': result_color})])
+        self.explanation_cache[key] = rendered
+        if len(self.explanation_cache) > EXPLANATION_CACHE_SIZE:
+            self.explanation_cache.popitem(last=False)
+        return rendered
+    
+    def show_explanation(self, question: Question, correct: bool):
+        """Put a question's rendered explanation into the explanation panel"""
+        content, tags = self.rendered_explanation(question, correct)
+        self.explanation_text.delete('1.0', 'end')
+        self.explanation_text.insert('1.0', content)
+        for tag, start, end, options in tags:
+            self.explanation_text.tag_add(tag, start, end)
+            self.explanation_text.tag_config(tag, **options)
+        
+        background = "#fef3c7" if correct else "#fee2e2"
+        self.explanation_frame.config(bg=background)
+        self.explanation_text.config(bg=background)
+    
+    def explanation_for(self, question: Question) -> str:
+        """Explanation text of a question in the selected language(s), loading a language on first use"""
+        languages = explanation_languages_for(self.explanation_language)
+        if len(languages) == 1:
+            return self.session_explanations.get(question.id, languages[0])
+        return "\n\n".join(f"{EXPLANATION_LANGUAGES[language][1]}:\n{self.session_explanations.get(question.id, language)}"
+                           for language in languages)
+    
+    def source_for(self, question: Question) -> Optional[QuestionSource]:
+        """Source entry of a question if it names a chapter (loads the source mapping on first use)"""
+        source = self.session_sources.get(question.id)
+        return source if source is not None and source.has_chapter else None
+    
+    def source_info_for(self, question: Question) -> str:
+        """Source information block appended to explanations (empty without a source)"""
+        source = self.source_for(question)
+        if source is None:
+            return ""
+        source_info = f"\n\n📚 Source Information:"
+        source_info += f"\n• Chapter: {source.source_chapter}"
+        if source.topic:
+            source_info += f"\n• Topic: {source.topic}"
+        if source.source:
+            source_info += f"\n• Details: {source.source}"
+        if source.source_reference:
+            source_info += f"\n• Reference: {source.source_reference}"
+        return source_info
     
     def toggle_explanation_language(self):
-        """Toggle between explanation languages"""
-        if self.explanation_language == "english":
-            self.explanation_language = "turkish"
-            new_lang = "Turkish 🇹🇷"
-        elif self.explanation_language == "turkish":
-            self.explanation_language = "both"
-            new_lang = "Both Languages 🌍"
-        else:  # both
-            self.explanation_language = "english"
-            new_lang = "English 🇬🇧"
+        """Cycle through the explanation languages (default first), then all of them at once"""
+        choices = [DEFAULT_EXPLANATION_LANGUAGE] + [language for language in EXPLANATION_LANGUAGES
+                                                    if language != DEFAULT_EXPLANATION_LANGUAGE]
+        choices.append(ALL_LANGUAGES_CHOICE)
+        position = choices.index(self.explanation_language) if self.explanation_language in choices else -1
+        self.explanation_language = choices[(position + 1) % len(choices)]
+        if self.explanation_language == ALL_LANGUAGES_CHOICE:
+            new_lang = "All Languages 🌍" if len(EXPLANATION_LANGUAGES) > 2 else "Both Languages 🌍"
+        else:
+            new_lang = EXPLANATION_LANGUAGES[self.explanation_language][1]
         
         # Update the language variable if it exists
         if hasattr(self, 'language_var'):
@@ -1220,53 +3266,13 @@ class EntrepreneurshipQuiz:
         
         # If an answer is already submitted, refresh the explanation
         if self.answer_submitted and self.quiz_mode in ["practice", "review"]:
-            question = self.questions[self.current_question_index]
-            selected = self.selected_answer.get()
-            correct_answer = question['correct']
-            
-            # Determine result
-            if selected == correct_answer:
-                result_icon = "✓"
-                result_color = "#16a34a"
-                result_text = "CORRECT!"
-            else:
-                result_icon = "✗"
-                result_color = "#dc2626"
-                result_text = f"INCORRECT! The correct answer is {correct_answer}"
-            
-            # Get explanation in the new language
-            explanation_text = ""
-            if self.explanation_language == "english":
-                explanation_text = question.get('explanation_english', question.get('explanation', 'No explanation available.'))
-            elif self.explanation_language == "turkish":
-                explanation_text = question.get('explanation_turkish', question.get('explanation', 'Açıklama mevcut değil.'))
-            elif self.explanation_language == "both":
-                turkish_exp = question.get('explanation_turkish', 'Türkçe açıklama mevcut değil.')
-                english_exp = question.get('explanation_english', 'No English explanation available.')
-                explanation_text = f"🇹🇷 Turkish:\n{turkish_exp}\n\n🇬🇧 English:\n{english_exp}"
-            
-            # Add source information if available
-            source_info = ""
-            if 'source_chapter' in question:
-                source_info = f"\n\n📚 Source Information:"
-                source_info += f"\n• Chapter: {question.get('source_chapter', 'N/A')}"
-                if question.get('topic'):
-                    source_info += f"\n• Topic: {question.get('topic', 'N/A')}"
-                if question.get('source'):
-                    source_info += f"\n• Details: {question.get('source', 'N/A')}"
-                if question.get('source_reference'):
-                    source_info += f"\n• Reference: {question.get('source_reference', 'N/A')}"
-            
-            # Update explanation display
-            explanation_content = f"{result_icon} {result_text}\n\n💡 Explanation:\n{explanation_text}{source_info}"
-            self.explanation_text.delete('1.0', 'end')
-            self.explanation_text.insert('1.0', explanation_content)
-            self.explanation_text.tag_add("result", "1.0", "1.end")
-            self.explanation_text.tag_config("result", font=('Arial', 12, 'bold'), foreground=result_color)
+            question = self.current_question()
+            self.show_explanation(question, self.selected_answer.get() == question.correct)
     
     def show_results(self):
         """Display the final results screen"""
-        self.clear_window()
+        if "results" not in self.screens:
+            self.build_results_screen()
         
         # Calculate statistics
         total_questions = len(self.questions)
@@ -1283,30 +3289,58 @@ class EntrepreneurshipQuiz:
         else:
             time_str = "N/A"
         
-        # Create a canvas with scrollbar for the results screen
-        canvas = tk.Canvas(self.root, bg="#f0f4f8", highlightthickness=0)
-        scrollbar = tk.Scrollbar(self.root, orient="vertical", command=canvas.yview)
-        scrollable_frame = tk.Frame(canvas, bg="#f0f4f8")
+        # Score display
+        self.score_label.config(text=f"{correct}/{total_questions}")
         
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
+        # Percentage
+        self.percentage_label.config(
+            text=f"{percentage:.1f}%",
+            fg="#16a34a" if percentage >= 70 else "#dc2626"
         )
         
-        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
+        # Performance message
+        if percentage >= 90:
+            message = "Outstanding! 🌟"
+            color = "#16a34a"
+        elif percentage >= 80:
+            message = "Excellent work! 👏"
+            color = "#16a34a"
+        elif percentage >= 70:
+            message = "Good job! 👍"
+            color = "#2563eb"
+        elif percentage >= 60:
+            message = "Keep practicing! 📚"
+            color = "#ea580c"
+        else:
+            message = "More study needed 💪"
+            color = "#dc2626"
         
-        # Pack scrollbar and canvas
-        scrollbar.pack(side="right", fill="y")
-        canvas.pack(side="left", fill="both", expand=True)
+        self.message_label.config(text=message, fg=color)
         
-        # Enable mouse wheel scrolling
-        def _on_mousewheel(event):
-            canvas.yview_scroll(int(-1*(event.delta/120)), "units")
-        canvas.bind_all("<MouseWheel>", _on_mousewheel)
+        # Detailed statistics
+        stats_text = f"""
+        ✓ Correct Answers: {correct}
+        ✗ Incorrect Answers: {incorrect}
+        ⏱ Time Taken: {time_str}
+        📊 Mode: {self.quiz_mode.title()}
+        """
+        self.stats_label.config(text=stats_text)
         
+        # Review incorrect button
+        if incorrect > 0:
+            self.review_missed_btn.config(
+                text=f"🔍 Review {incorrect} Missed Question{'s' if incorrect != 1 else ''}"
+            )
+            self.review_missed_btn.grid(row=0, column=1, padx=10)
+        else:
+            self.review_missed_btn.grid_remove()
+        
+        self.show_screen("results")
+    
+    def build_results_screen(self):
+        """Build the results screen once; show_results fills in each session's figures"""
         # Main container inside scrollable frame
-        container = tk.Frame(scrollable_frame, bg="#f0f4f8")
+        container = tk.Frame(self.build_screen("results"), bg="#f0f4f8")
         container.pack(expand=True, fill='both', padx=40, pady=40)
         
         # Title
@@ -1324,69 +3358,39 @@ class EntrepreneurshipQuiz:
         results_frame.pack(fill='both', expand=True, pady=20)
         
         # Score display
-        score_text = f"{correct}/{total_questions}"
-        score_label = tk.Label(
+        self.score_label = tk.Label(
             results_frame,
-            text=score_text,
             font=('Arial', 48, 'bold'),
             bg="white",
             fg="#1e3a8a"
         )
-        score_label.pack(pady=(20, 10))
+        self.score_label.pack(pady=(20, 10))
         
         # Percentage
-        percentage_label = tk.Label(
+        self.percentage_label = tk.Label(
             results_frame,
-            text=f"{percentage:.1f}%",
             font=('Arial', 32, 'bold'),
-            bg="white",
-            fg="#16a34a" if percentage >= 70 else "#dc2626"
+            bg="white"
         )
-        percentage_label.pack(pady=(0, 20))
+        self.percentage_label.pack(pady=(0, 20))
         
         # Performance message
-        if percentage >= 90:
-            message = "Outstanding! 🌟"
-            color = "#16a34a"
-        elif percentage >= 80:
-            message = "Excellent work! 👏"
-            color = "#16a34a"
-        elif percentage >= 70:
-            message = "Good job! 👍"
-            color = "#2563eb"
-        elif percentage >= 60:
-            message = "Keep practicing! 📚"
-            color = "#ea580c"
-        else:
-            message = "More study needed 💪"
-            color = "#dc2626"
-        
-        message_label = tk.Label(
+        self.message_label = tk.Label(
             results_frame,
-            text=message,
             font=('Arial', 18, 'bold'),
-            bg="white",
-            fg=color
+            bg="white"
         )
-        message_label.pack(pady=(0, 20))
+        self.message_label.pack(pady=(0, 20))
         
         # Detailed statistics
-        stats_text = f"""
-        ✓ Correct Answers: {correct}
-        ✗ Incorrect Answers: {incorrect}
-        ⏱ Time Taken: {time_str}
-        📊 Mode: {self.quiz_mode.title()}
-        """
-        
-        stats_label = tk.Label(
+        self.stats_label = tk.Label(
             results_frame,
-            text=stats_text,
             font=('Arial', 12),
             bg="white",
             fg="#334155",
             justify='left'
         )
-        stats_label.pack(pady=(0, 20))
+        self.stats_label.pack(pady=(0, 20))
         
         # Action buttons
         button_frame = tk.Frame(container, bg="#f0f4f8")
@@ -1401,15 +3405,12 @@ class EntrepreneurshipQuiz:
         )
         retry_btn.grid(row=0, column=0, padx=10)
         
-        # Review incorrect button
-        if incorrect > 0:
-            review_btn = ttk.Button(
-                button_frame,
-                text=f"🔍 Review {incorrect} Missed Question{'s' if incorrect != 1 else ''}",
-                style='Mode.TButton',
-                command=lambda: self.start_quiz("review")
-            )
-            review_btn.grid(row=0, column=1, padx=10)
+        # Review incorrect button (gridded by show_results when questions were missed)
+        self.review_missed_btn = ttk.Button(
+            button_frame,
+            style='Mode.TButton',
+            command=lambda: self.start_quiz("review")
+        )
         
         # Back to menu button
         menu_btn = ttk.Button(
@@ -1429,11 +3430,442 @@ class EntrepreneurshipQuiz:
             self.show_start_screen()
 
 
+# ==================== HEADLESS BANK COMPILER ====================
+# Below this many questions a parse is treated as broken (matches the app's warning)
+MIN_COMPILED_QUESTIONS = 10
+
+
+def validate_questions(questions, unanswered_ids: Iterable[int] = ()) -> List[str]:
+    """Return a list of problems that make a parsed bank unfit to ship (empty if valid)"""
+    unanswered_ids = set(unanswered_ids)
+    problems = []
+    if len(questions) < MIN_COMPILED_QUESTIONS:
+        problems.append(f"only {len(questions)} questions parsed (expected at least {MIN_COMPILED_QUESTIONS})")
+    
+    seen_ids = set()
+    for question in questions:
+        label = f"Q{question.id}"
+        if question.id in seen_ids:
+            problems.append(f"{label}: duplicate question id")
+        seen_ids.add(question.id)
+        if not question.question:
+            problems.append(f"{label}: empty question text")
+        missing = [letter for letter, text in question.option_items() if not text]
+        if missing:
+            problems.append(f"{label}: missing option(s) {', '.join(missing)}")
+        if question.correct not in OPTION_LETTERS:
+            problems.append(f"{label}: invalid correct answer {question.correct!r}")
+        if question.id in unanswered_ids:
+            problems.append(f"{label}: no answer key entry")
+    return problems
+
+
+def compile_question_bank(output_path: str, pdf_dir: str = ".", parallel: Optional[bool] = None) -> int:
+    """Extract the PDFs in pdf_dir into a compiled bank at output_path, without any UI
+    
+    Returns a process exit status: 0 on success, 1 if the parse or the written bank is invalid.
+    """
+    answer_keys = answer_key_pdfs(pdf_dir)
+    for path in (os.path.join(pdf_dir, QUESTIONS_PDF), answer_keys['turkish']):
+        if not os.path.exists(path):
+            print(f"❌ Required PDF not found: {path}", file=sys.stderr)
+            return 1
+    if get_pdf_library() is None:
+        print("❌ No PDF library available; install one with: pip install PyPDF2 pdfplumber", file=sys.stderr)
+        return 1
+    
+    if parallel is None:
+        parallel = (os.cpu_count() or 1) > 1
+    # Shipped banks carry the explanations of every language
+    extractor = PDFQuestionExtractor(os.path.join(pdf_dir, QUESTIONS_PDF), answer_keys,
+                                     os.path.join(pdf_dir, SOURCE_MAPPING_PDF))
+    questions = extractor.extract_all_questions(parallel=parallel)
+    if extractor.used_fallback:
+        print("❌ Extraction failed (fallback questions were used); bank not written", file=sys.stderr)
+        return 1
+    
+    problems = validate_questions(questions, extractor.unanswered_ids)
+    if problems:
+        print(f"❌ Parsed bank failed validation ({len(problems)} problems); bank not written:", file=sys.stderr)
+        for problem in problems:
+            print(f"   - {problem}", file=sys.stderr)
+        return 1
+    
+    write_question_bank(output_path, questions, {
+        'key': extractor.compute_cache_key(),
+        'compiled_at': datetime.now().isoformat(timespec='seconds'),
+        'pdf_backends': extractor.pdf_backends
+    }, extractor.explanations, extractor.sources)
+    
+    # Read the bank back so a truncated or corrupt write is caught on the build box
+    bank = open_question_bank(output_path)
+    if bank is None:
+        print(f"❌ Written bank '{output_path}' could not be reopened", file=sys.stderr)
+        return 1
+    try:
+        if (list(bank) != questions or bank.load_sources() != (extractor.sources or {}) or
+                any(bank.load_explanations(language) != texts for language, texts in extractor.explanations.items())):
+            print(f"❌ Written bank '{output_path}' does not match the parsed questions", file=sys.stderr)
+            return 1
+    finally:
+        bank.close()
+    
+    print(f"✓ Compiled {len(questions)} questions into '{output_path}'")
+    return 0
+
+
+# ==================== PARSER BENCHMARK ====================
+def build_synthetic_bank_pages(question_count: int, questions_per_page: int = 7) -> List[str]:
+    """Build page texts shaped like the midterm PDF for parser benchmarks"""
+    pages = []
+    page = ["SAMPLE MULTIPLE CHOICE QUESTIONS\n"]
+    for q_num in range(1, question_count + 1):
+        page.append(
+            f"{q_num}. Synthetic question {q_num} about entrepreneurial opportunity relates to ________.\n"
+            f"A) first option for {q_num} B) second option, with a comma\n"
+            f"C) third option (see chapter {q_num % 12 + 1}) D) All of the above\n"
+        )
+        if len(page) == questions_per_page:
+            pages.append(" ".join(page))
+            page = []
+    if page:
+        pages.append(" ".join(page))
+    return pages
+
+
+def benchmark_question_parser(sizes=(100, 1000, 10000, 100000)):
+    """Print question-parser throughput on synthetic banks of increasing size"""
+    extractor = PDFQuestionExtractor("", {})
+    print(f"{'Questions':>10} {'Parsed':>10} {'Seconds':>10} {'Questions/s':>14}")
+    for size in sizes:
+        pages = build_synthetic_bank_pages(size)
+        start = time.perf_counter()
+        parsed = sum(1 for _ in extractor.iter_questions(pages))
+        elapsed = time.perf_counter() - start
+        print(f"{size:>10} {parsed:>10} {elapsed:>10.4f} {parsed / elapsed:>14,.0f}")
+
+
+# ==================== LOAD PROFILING ====================
+def run_cold_load(trace_memory: bool, parallel: bool) -> tuple:
+    """Extract, compile and reopen the bank once; returns (extractor, questions, stats, total wall)"""
+    import tempfile
+    
+    extractor = PDFQuestionExtractor(QUESTIONS_PDF, answer_key_pdfs(), SOURCE_MAPPING_PDF)
+    stats = extractor.load_stats = LoadStats(trace_memory=trace_memory)
+    
+    wall_start = time.perf_counter()
+    questions = extractor.extract_all_questions(parallel=parallel)
+    with tempfile.TemporaryDirectory() as temp_dir:
+        bank_path = os.path.join(temp_dir, BANK_CACHE_FILE)
+        with stats.stage("bank write"):
+            write_question_bank(bank_path, questions, {'key': extractor.compute_cache_key()},
+                                extractor.explanations, extractor.sources)
+        with stats.stage("bank open"):
+            bank = MappedQuestionBank(bank_path)
+        bank.close()
+    return extractor, questions, stats, time.perf_counter() - wall_start
+
+
+def profile_question_load(report_path: Optional[str] = None, parallel: Optional[bool] = None) -> LoadStats:
+    """Profile a full cold load per stage: wall and CPU time, plus tracemalloc peaks
+    
+    tracemalloc slows PDF extraction down many times over, so times come from an
+    untraced pass and memory peaks from a second, traced pass. Prints a stage
+    table and, if report_path is given, writes it as a JSON report.
+    """
+    if parallel is None:
+        parallel = (os.cpu_count() or 1) > 1
+    extractor, questions, stats, total_wall = run_cold_load(False, parallel)
+    _, _, traced_stats, _ = run_cold_load(True, parallel)
+    peaks = {timing.name: timing.peak_bytes for timing in traced_stats.stages}
+    for timing in stats.stages:
+        timing.peak_bytes = peaks.get(timing.name)
+    stats.trace_memory = True
+    
+    print()
+    print(stats.format_table())
+    slowest = stats.slowest()
+    print(f"\nTotal: {total_wall:.4f} s for {len(questions)} questions"
+          f"{' (fallback)' if extractor.used_fallback else ''}; slowest stage: {slowest.name}")
+    
+    if report_path:
+        report = {
+            'parser_version': PARSER_VERSION,
+            'pdf_backends': extractor.pdf_backends,
+            'parallel': parallel,
+            'cpu_count': os.cpu_count(),
+            'question_count': len(questions),
+            'used_fallback': extractor.used_fallback,
+            'total_wall_seconds': round(total_wall, 6),
+            **stats.to_dict()
+        }
+        with open(report_path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"✓ Load profile written to '{report_path}'")
+    return stats
+
+
+# ==================== IMPORT-TIME BUDGET ====================
+# Budget for importing this module, as the best of several fresh interpreters
+IMPORT_TIME_BUDGET_MS = 50.0
+# Heavy packages that must only ever be imported on demand
+ON_DEMAND_PACKAGES = ('tkinter', 'PyPDF2', 'pdfplumber')
+
+
+def measure_import_time(runs: int = 5) -> tuple:
+    """Import this module in fresh interpreters under -X importtime
+    
+    Returns (best cumulative import time in ms, set of top-level packages imported).
+    """
+    import subprocess
+    import tempfile
+    
+    module_dir = os.path.dirname(os.path.abspath(__file__))
+    module_name = os.path.splitext(os.path.basename(__file__))[0]
+    best_us = None
+    imported = set()
+    # Bytecode is written to (and read from) a private cache even under PYTHONDONTWRITEBYTECODE,
+    # so only the untimed first run compiles; timed runs measure the import, not the compiler
+    env = dict(os.environ)
+    env.pop('PYTHONDONTWRITEBYTECODE', None)
+    with tempfile.TemporaryDirectory() as pycache_dir:
+        for run in range(runs + 1):
+            result = subprocess.run([sys.executable, '-X', 'importtime', '-X', f'pycache_prefix={pycache_dir}',
+                                     '-c', f'import {module_name}'],
+                                    cwd=module_dir, env=env, capture_output=True, text=True, check=True)
+            for line in result.stderr.splitlines():
+                fields = line.split('|')
+                if not line.startswith('import time:') or not fields[1].strip().isdigit():
+                    continue
+                package = fields[2].strip()
+                imported.add(package.split('.')[0])
+                if run and package == module_name:
+                    cumulative_us = int(fields[1])
+                    best_us = cumulative_us if best_us is None else min(best_us, cumulative_us)
+    return best_us / 1000, imported
+
+
+def check_import_time(budget_ms: float = IMPORT_TIME_BUDGET_MS) -> int:
+    """Fail (exit status 1) if importing this module is over budget or pulls in a heavy package eagerly"""
+    if getattr(sys, 'frozen', False):
+        print("❌ The import-time check needs the Python source, not a frozen build", file=sys.stderr)
+        return 1
+    
+    import_ms, imported = measure_import_time()
+    eager = [package for package in ON_DEMAND_PACKAGES if package in imported]
+    print(f"Import time: {import_ms:.1f} ms (budget {budget_ms:.1f} ms)")
+    
+    status = 0
+    if import_ms > budget_ms:
+        print(f"❌ Import time is over budget by {import_ms - budget_ms:.1f} ms", file=sys.stderr)
+        status = 1
+    if eager:
+        print(f"❌ Imported at module load but should be on demand: {', '.join(eager)}", file=sys.stderr)
+        status = 1
+    if status == 0:
+        print("✓ Import time within budget")
+    return status
+
+
+# ==================== SELF-TEST ====================
+# Fragments the random question texts of the parser check are built from
+SELF_TEST_FRAGMENTS = (' 1. ', ' 2. ', ' 12.  ', 'A)', 'B)', 'C)', 'D)', ' A) ', ' B) ', 'x', 'word ', ' ',
+                       '\n', '(B)', '3.', ' 4.\n', 'AB)', 'D)D)', '*')
+# Simple-layout answer keys whose rows are easy to lose: (page texts, expected {number: answer})
+SELF_TEST_SIMPLE_KEYS = [
+    (["1. C the year 2019. A study found this 2. B two 3. D three 4. A four"],
+     {1: 'C', 2: 'B', 3: 'D', 4: 'A'}),
+    (["1. A one 2. B two 3. C three 10. D ten"], {1: 'A', 2: 'B', 3: 'C', 10: 'D'}),
+    (["1. A one, see 1. B above 2. B two", "3. C three 12. D twelve 13. A thirteen"],
+     {1: 'A', 2: 'B', 3: 'C', 12: 'D', 13: 'A'}),
+]
+
+
+def reference_parse_questions(text: str) -> List[Question]:
+    """The split-then-regex-per-option parser tokenize_questions replaced, kept as its reference"""
+    questions = []
+    blocks = PDFQuestionExtractor.QUESTION_SPLIT_PATTERN.split(text)
+    for i in range(1, len(blocks) - 1, 2):
+        content = blocks[i + 1].strip()
+        options_start = content.find('A)')
+        if options_start == -1:
+            continue
+        stem, options_text = content[:options_start].strip(), content[options_start:]
+        options = {}
+        for letter in OPTION_LETTERS:
+            match = re.search(rf'{letter}\)(.*?)(?=[B-D]\)|$)', options_text, re.DOTALL)
+            if match:
+                options[letter] = match.group(1).strip()
+        if len(options) == 4 and stem:
+            questions.append(Question(int(blocks[i]), stem, options))
+    return questions
+
+
+def self_test_question_parser(rng: random.Random, trials: int = 20000) -> List[str]:
+    """Compare the streaming tokenizer with the reference parser on random and synthetic page streams"""
+    extractor = PDFQuestionExtractor("", {})
+    streams = [build_synthetic_bank_pages(500)]
+    for _ in range(trials):
+        streams.append([''.join(rng.choice(SELF_TEST_FRAGMENTS) for _ in range(rng.randint(0, 15)))
+                        for _ in range(rng.randint(1, 5))])
+    for pages in streams:
+        expected = reference_parse_questions(extractor.normalize_text("".join(page + "\n" for page in pages)))
+        if list(extractor.iter_questions(pages)) != expected:
+            return [f"question parser differs from the reference parser on pages {pages!r}"]
+    return []
+
+
+def self_test_simple_answers() -> List[str]:
+    """Parse the simple-layout answer keys of SELF_TEST_SIMPLE_KEYS"""
+    extractor = PDFQuestionExtractor("", {})
+    failures = []
+    for pages, expected in SELF_TEST_SIMPLE_KEYS:
+        parsed = {q_num: answer['correct'] for q_num, answer in extractor.parse_simple_answer_pages(pages).items()}
+        if parsed != expected:
+            failures.append(f"simple answer key {pages!r} parsed as {parsed}, expected {expected}")
+    return failures
+
+
+def self_test_bank_round_trip(rng: random.Random, temp_dir: str) -> List[str]:
+    """Write random banks (sorted and unsorted ids) and read every field back through MappedQuestionBank"""
+    failures = []
+    for sorted_ids in (True, False):
+        ids = rng.sample(range(1, 1000), 60)
+        if sorted_ids:
+            ids.sort()
+        questions = [Question(q_id, f"Question {q_id} – ________? {rng.random()}",
+                              [f"Option {letter} {rng.randint(0, 5)}" for letter in OPTION_LETTERS],
+                              rng.choice(OPTION_LETTERS))
+                     for q_id in ids]
+        explanations = {language: {q_id: f"{language} explanation {q_id} ✓" for q_id in ids if rng.random() < 0.8}
+                        for language in EXPLANATION_LANGUAGES}
+        sources = {q_id: QuestionSource(f"Source {q_id}", f"Chapter {q_id % 7}", "ENT 101 Notes.pdf",
+                                        f"[[{q_id % 3}]]", f"Topic {q_id % 5}")
+                   for q_id in ids if rng.random() < 0.8}
+        path = os.path.join(temp_dir, f"self_test_{sorted_ids}.entbank")
+        write_question_bank(path, questions, {'key': 'self-test'}, explanations, sources)
+        bank = MappedQuestionBank(path)
+        try:
+            checks = [
+                ("questions", list(bank) == questions),
+                ("lookup by id", all(bank.get_by_id(q.id) == q for q in questions) and bank.get_by_id(0) is None),
+                ("meta", bank.meta.get('key') == 'self-test'),
+                ("explanations", all(bank.load_explanations(language) == texts
+                                     for language, texts in explanations.items())),
+                ("source mapping", bank.load_sources() == sources),
+            ]
+        finally:
+            bank.close()
+        failures += [f"bank round trip ({'sorted' if sorted_ids else 'unsorted'} ids): {name} differ"
+                     for name, passed in checks if not passed]
+    return failures
+
+
+def self_test_page_cache(temp_dir: str) -> List[str]:
+    """Save and reopen a page cache, and read through an instance whose file was replaced"""
+    path = os.path.join(temp_dir, PAGE_CACHE_FILE)
+    first = PageCache()
+    first.load(path)
+    first.begin_rewrite()
+    first.put('lib:aaa', "page A text")
+    first.put('lib:bbb', "page B text\twith a tab")
+    first.save({'questions': ['aaa', 'lib']})
+    
+    reopened = PageCache()
+    reopened.load(path)
+    failures = []
+    if (reopened.get('lib:aaa'), reopened.get('lib:bbb'), reopened.choices) != \
+            ("page A text", "page B text\twith a tab", {'questions': ['aaa', 'lib']}):
+        failures.append("page cache does not read back what it saved")
+    
+    # Another load rewrites the file with the pages in a different order
+    reopened.begin_rewrite()
+    reopened.put('lib:ccc', "page C text, longer than the others")
+    reopened.put('lib:bbb', "page B text\twith a tab")
+    reopened.save({})
+    if (first.get('lib:aaa'), first.get('lib:bbb')) != (None, "page B text\twith a tab"):
+        failures.append("page cache returns another page's text after its file was replaced")
+    return failures
+
+
+def run_self_test(trials: int = 20000) -> int:
+    """Check the parsers, the compiled bank format and the page cache; exit status 1 on any failure"""
+    import tempfile
+    
+    rng = random.Random(101)
+    with tempfile.TemporaryDirectory() as temp_dir:
+        checks = [
+            ("Question parser matches the reference parser", lambda: self_test_question_parser(rng, trials)),
+            ("Simple answer keys keep every row", self_test_simple_answers),
+            ("Compiled bank round trip", lambda: self_test_bank_round_trip(rng, temp_dir)),
+            ("Page cache round trip", lambda: self_test_page_cache(temp_dir)),
+        ]
+        status = 0
+        for name, check in checks:
+            try:
+                failures = check()
+            except Exception as e:
+                failures = [f"{name}: {type(e).__name__}: {e}"]
+            if failures:
+                status = 1
+                for failure in failures:
+                    print(f"❌ {failure}", file=sys.stderr)
+            else:
+                print(f"✓ {name}")
+    return status
+
+
 # ==================== MAIN EXECUTION ====================
 def main():
     """Main entry point for the application"""
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="ENT 101 Entrepreneurship Quiz")
+    parser.add_argument('--benchmark-parser', action='store_true',
+                        help="print question parser throughput on synthetic banks and exit")
+    parser.add_argument('--profile-load', nargs='?', const='load_profile.json', metavar='REPORT',
+                        help="extract the bank from the PDFs with per-stage timing and memory stats, "
+                             "write a JSON report (default: load_profile.json) and exit")
+    parser.add_argument('--compile-bank', nargs='?', const=BANK_CACHE_FILE, metavar='OUTPUT',
+                        help="extract the PDFs into a validated compiled bank "
+                             f"(default: {BANK_CACHE_FILE}) without starting the UI, and exit")
+    parser.add_argument('--pdf-dir', default='.',
+                        help="directory holding the source PDFs for --compile-bank (default: current directory)")
+    parser.add_argument('--debug-dump', nargs='?', const=DEBUG_DUMP_FILE, metavar='PATH',
+                        help="write every bank extracted from the PDFs to PATH as JSONL "
+                             f"(default: {DEBUG_DUMP_FILE}); same as setting {DEBUG_DUMP_ENV}")
+    parser.add_argument('--watch', action='store_true',
+                        help="watch the PDFs and reload the question bank when one changes")
+    parser.add_argument('--check-import-time', nargs='?', const=IMPORT_TIME_BUDGET_MS, type=float,
+                        metavar='BUDGET_MS',
+                        help="measure this module's import time with -X importtime and exit with status 1 "
+                             f"if it exceeds the budget (default: {IMPORT_TIME_BUDGET_MS:g} ms) "
+                             "or imports tkinter or a PDF library eagerly")
+    parser.add_argument('--self-test', action='store_true',
+                        help="check the question parser against the reference parser, the compiled bank "
+                             "format and the page cache, and exit with status 1 on any failure")
+    args = parser.parse_args()
+    if args.debug_dump:
+        # Via the environment so every extractor, including reloads and workers, sees it
+        os.environ[DEBUG_DUMP_ENV] = args.debug_dump
+    
+    # Headless commands: these never import tkinter
+    if args.benchmark_parser:
+        benchmark_question_parser()
+        return 0
+    if args.profile_load:
+        profile_question_load(args.profile_load)
+        return 0
+    if args.compile_bank:
+        return compile_question_bank(args.compile_bank, args.pdf_dir)
+    if args.check_import_time is not None:
+        return check_import_time(args.check_import_time)
+    if args.self_test:
+        return run_self_test()
+    
+    load_tkinter()
     root = tk.Tk()
-    app = EntrepreneurshipQuiz(root)
+    app = EntrepreneurshipQuiz(root, watch=args.watch)
     
     # Center window on screen
     root.update_idletasks()
@@ -1444,7 +3876,11 @@ def main():
     root.geometry(f'{width}x{height}+{x}+{y}')
     
     root.mainloop()
+    return 0
 
 
 if __name__ == "__main__":
-    main()
+    # Needed for the extraction process pool in frozen (PyInstaller) builds
+    import multiprocessing
+    multiprocessing.freeze_support()
+    sys.exit(main())